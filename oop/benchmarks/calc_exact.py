@@ -0,0 +1,98 @@
+"""
+Бенчмарк точного режиму (Decimal) проти float на довгих ланцюжках операцій
+Запуск: python benchmarks/calc_exact.py [--length 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'calc'))
+
+from core import CalculatorEngine, CalculatorState  # noqa: E402
+from core.exact import format_exact, to_exact  # noqa: E402
+
+OPERANDS = {
+    '+': ['0.1', '0.2', '1.05', '3.3'],
+    '-': ['0.1', '0.7', '2.2'],
+    '×': ['1.1', '0.9', '1.01'],
+    '/': ['1.1', '0.9', '1.01'],
+}
+
+
+def make_chain(length: int, seed: int):
+    """Ланцюжок токенів кнопок: 1 op x op x ... = та еталонне значення (Fraction)"""
+    rng = random.Random(seed)
+    tokens = ['1']
+    reference = Fraction(1)
+    for _ in range(length):
+        op = rng.choice('+-×/')
+        operand = rng.choice(OPERANDS[op])
+        tokens.append(op)
+        tokens.extend(operand)
+        value = Fraction(operand)
+        if op == '+':
+            reference += value
+        elif op == '-':
+            reference -= value
+        elif op == '×':
+            reference *= value
+        else:
+            reference /= value
+    tokens.append('=')
+    return tokens, reference
+
+
+def run_chain(tokens, exact: bool):
+    state = CalculatorState()
+    engine = CalculatorEngine(state)
+    engine.set_exact_mode(exact)
+    press = engine.press
+    started = time.perf_counter()
+    for token in tokens:
+        press(token)
+    return state.current_value, time.perf_counter() - started
+
+
+def bench_formatting(number: int = 200_000):
+    values = [random.Random(i).uniform(-1e6, 1e6) for i in range(1000)]
+    exact_values = [to_exact(v) for v in values]
+
+    started = time.perf_counter()
+    for _ in range(number // len(values)):
+        for v in values:
+            result = f"{v:.10f}".rstrip('0').rstrip('.')
+            result if result != '-0' else '0'
+    float_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(number // len(values)):
+        for v in exact_values:
+            format_exact(v)
+    exact_time = time.perf_counter() - started
+    return float_time / number * 1e9, exact_time / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decimal проти float у калькуляторі")
+    parser.add_argument('--length', type=int, default=20000, help="кількість операцій у ланцюжку")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    tokens, reference = make_chain(args.length, args.seed)
+    operations = args.length
+    for name, exact in (('float', False), ('Decimal', True)):
+        display, elapsed = run_chain(tokens, exact)
+        error = abs(Fraction(display) - reference) if display != 'Помилка' else None
+        print(f"{name:<8} {operations / elapsed:>12,.0f} операцій/с   результат: {display[:24]:<24} "
+              f"похибка: {float(error):.3e}" if error is not None else f"{name}: помилка")
+
+    float_ns, exact_ns = bench_formatting()
+    print(f"форматування: float {float_ns:.0f} нс, Decimal {exact_ns:.0f} нс на значення")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Бенчмарк: ціла арифметика BIN/HEX проти старого шляху через float
+Запуск: python benchmarks/calc_int_ops.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'calc'))
+
+from core import BinarySystem, HexadecimalSystem, OperationFactory, OperationType  # noqa: E402
+
+
+CASES = {
+    'BIN': (BinarySystem(), '1' * 32, '1' * 31),
+    'HEX': (HexadecimalSystem(), 'FFFFFFFF', 'FFFFFFFF'),
+}
+
+OPERATIONS = [OperationType.ADD, OperationType.SUBTRACT,
+              OperationType.MULTIPLY, OperationType.DIVIDE]
+
+
+def float_path(system, operation, a: str, b: str) -> str:
+    """Старий шлях: str -> int -> float -> операція -> int -> str"""
+    result = operation.execute(float(system.to_decimal(a)), float(system.to_decimal(b)))
+    return system.from_decimal(int(result))
+
+
+def int_path(system, operation, a: str, b: str) -> str:
+    """Новий шлях: str -> int -> цілочисельна операція -> str"""
+    result = operation.execute_int(system.to_decimal(a), system.to_decimal(b))
+    return system.from_decimal(result)
+
+
+def main(number: int = 200_000) -> None:
+    print(f"{'режим':<6}{'операція':<10}{'float, нс':>12}{'int, нс':>12}{'прискорення':>14}  точно")
+    for mode, (system, a, b) in CASES.items():
+        for op_type in OPERATIONS:
+            operation = OperationFactory.get_operation(op_type)
+            t_float = timeit.timeit(lambda: float_path(system, operation, a, b), number=number)
+            t_int = timeit.timeit(lambda: int_path(system, operation, a, b), number=number)
+            exact = float_path(system, operation, a, b) == int_path(system, operation, a, b)
+            print(f"{mode:<6}{op_type.value:<10}{t_float / number * 1e9:>12.1f}"
+                  f"{t_int / number * 1e9:>12.1f}{t_float / t_int:>13.2f}x  {'так' if exact else 'НІ'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Генератор навантаження для calc/server.py: затримки p50/p99 та запитів за секунду
+Запуск: python benchmarks/calc_server_load.py --clients 200 --sessions 5000 --requests 50000
+Без --port піднімає сервер у цьому ж процесі на вільному порту.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'calc'))
+
+from server import CalculatorServer, SessionPool  # noqa: E402
+
+
+KEYS = list('0123456789') + ['+', '-', '×', '/', '=', '.', '±', '←']
+
+
+async def client(host: str, port: int, sessions: int, requests: int, latencies: list, rng: random.Random):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(requests):
+            request = {
+                'session': f"s{rng.randrange(sessions)}",
+                'keys': [rng.choice(KEYS) for _ in range(rng.randint(1, 6))],
+            }
+            started = time.perf_counter()
+            writer.write(json.dumps(request).encode('utf-8') + b'\n')
+            await writer.drain()
+            json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+
+
+async def run(args) -> None:
+    server = None
+    host, port = args.host, args.port
+    if port is None:
+        server = CalculatorServer(SessionPool(idle_timeout=args.idle_timeout))
+        listener = await server.start(host=host, port=0)
+        port = listener.sockets[0].getsockname()[1]
+
+    latencies = []
+    per_client = args.requests // args.clients
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, args.sessions, per_client, latencies, random.Random(rng.random()))
+        for _ in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"клієнтів: {args.clients}, сесій: {args.sessions}, запитів: {len(latencies)}")
+    print(f"p50: {p50 * 1e3:.3f} мс   p99: {p99 * 1e3:.3f} мс   пропускна здатність: {len(latencies) / elapsed:,.0f} запитів/с")
+    if server is not None:
+        print(f"активних сесій на сервері: {len(server.pool)}, витіснено: {server.pool.evicted}")
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Навантажувальний тест сервера калькулятора")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=None, help="порт зовнішнього сервера")
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--sessions', type=int, default=2000)
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--idle-timeout', type=float, default=300.0)
+    parser.add_argument('--seed', type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Бенчмарк старту: час імпорту ядра калькулятора та час до першого результату
+Кожен замір - окремий чистий процес інтерпретатора; повертає код 1 при регресії.
+Запуск: python benchmarks/calc_startup.py [--runs 15] [--max-import-ms 30] [--max-first-ms 40]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CALC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'calc')
+
+PROBE = '''
+import json, sys, time
+started = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+from core import CalculatorEngine, CalculatorState
+state = CalculatorState()
+engine = CalculatorEngine(state)
+for key in ('1', '2', '+', '3', '0', '='):
+    engine.press(key)
+assert state.current_value == '42'
+finished = time.perf_counter()
+print(json.dumps({{
+    'import_ms': (imported - started) * 1e3,
+    'first_result_ms': (finished - started) * 1e3,
+    'heavy_modules': sorted(m for m in ('tkinter', 'numpy') if m in sys.modules),
+}}))
+'''
+
+
+def measure(module: str, runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(module=module)],
+            cwd=CALC_DIR, capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(json.loads(output))
+    return {
+        'import_ms': statistics.median(s['import_ms'] for s in samples),
+        'first_result_ms': statistics.median(s['first_result_ms'] for s in samples),
+        'heavy_modules': samples[0]['heavy_modules'],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Час старту ядра калькулятора")
+    parser.add_argument('--runs', type=int, default=15)
+    parser.add_argument('--max-import-ms', type=float, default=30.0)
+    parser.add_argument('--max-first-ms', type=float, default=40.0)
+    args = parser.parse_args()
+
+    failed = False
+    for module in ('core', 'main', 'gui'):
+        result = measure(module, args.runs)
+        print(f"{module:<6} імпорт: {result['import_ms']:7.2f} мс   "
+              f"перший результат: {result['first_result_ms']:7.2f} мс   "
+              f"важкі модулі: {', '.join(result['heavy_modules']) or '-'}")
+        if module == 'gui':
+            continue  # GUI лише для порівняння, бюджет на нього не поширюється
+        if result['heavy_modules']:
+            print(f"  РЕГРЕСІЯ: {module} тягне {', '.join(result['heavy_modules'])}")
+            failed = True
+        if result['import_ms'] > args.max_import_ms or result['first_result_ms'] > args.max_first_ms:
+            print(f"  РЕГРЕСІЯ: {module} перевищує бюджет "
+                  f"({args.max_import_ms} / {args.max_first_ms} мс)")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
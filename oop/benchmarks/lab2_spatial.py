@@ -0,0 +1,82 @@
+"""
+Бенчмарк: пошук фігури під курсором у lab2 - сітка GridIndex проти лінійного перебору
+Запуск: python benchmarks/lab2_spatial.py [--shapes 1000000] [--queries 10000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lab2'))
+
+from shape_store import ShapeStore, shape_bounds, np  # noqa: E402
+from spatial_index import GridIndex  # noqa: E402
+
+WIDTH, HEIGHT = 4000, 4000
+
+
+def build(count: int, rng: random.Random):
+    store = ShapeStore()
+    for _ in range(count):
+        x, y = rng.randrange(WIDTH), rng.randrange(HEIGHT)
+        store.append(rng.randrange(4), x, y, x + rng.randint(-40, 40), y + rng.randint(-40, 40))
+    index = GridIndex()
+    started = time.perf_counter()
+    for i in range(count):
+        index.insert(i, store.bounds(i))
+    return store, index, time.perf_counter() - started
+
+
+def linear_pick(store: ShapeStore, x: int, y: int):
+    best = None
+    for i, row in store.live_rows():
+        left, top, right, bottom = shape_bounds(*row)
+        if left <= x <= right and top <= y <= bottom:
+            best = i
+    return best
+
+
+def numpy_pick(store: ShapeStore, x: int, y: int):
+    hits = store.find_in_rect(x, y, x, y)
+    return hits[-1] if hits else None
+
+
+def per_query_us(pick, store, points) -> float:
+    started = time.perf_counter()
+    for x, y in points:
+        pick(store, x, y)
+    return (time.perf_counter() - started) / len(points) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сітковий індекс проти лінійного перебору")
+    parser.add_argument('--shapes', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=10_000)
+    parser.add_argument('--linear-queries', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    store, index, build_time = build(args.shapes, rng)
+    points = [(rng.randrange(WIDTH), rng.randrange(HEIGHT)) for _ in range(args.queries)]
+    sample = points[:args.linear_queries]
+
+    for x, y in sample:
+        assert index.pick(x, y) == linear_pick(store, x, y)
+
+    grid_us = per_query_us(lambda _, x, y: index.pick(x, y), store, points)
+    linear_us = per_query_us(linear_pick, store, sample)
+    print(f"фігур: {args.shapes:,}, клітинок сітки: {len(index.cells):,}, "
+          f"великих фігур: {len(index.large)}, побудова індексу: {build_time:.2f} с")
+    print(f"{'метод':<22}{'мкс/запит':>14}")
+    print(f"{'сітка GridIndex':<22}{grid_us:>14.2f}")
+    print(f"{'лінійний перебір':<22}{linear_us:>14.2f}")
+    if np is not None:
+        print(f"{'NumPy-перебір':<22}{per_query_us(numpy_pick, store, sample):>14.2f}")
+    print(f"прискорення сітки проти перебору: x{linear_us / grid_us:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
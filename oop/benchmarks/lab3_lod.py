@@ -0,0 +1,86 @@
+"""
+Бенчмарк рівнів деталізації lab3: вартість перемальовування залежно від кількості фігур
+Порівнює LodRenderer з повним малюванням кожної фігури в растр Pillow.
+Запуск: python benchmarks/lab3_lod.py [--sizes 1000 10000 100000 1000000] [--naive-max 100000]
+Кожна фігура - окремий об'єкт у випадковому місці (1M фігур - близько 250 МБ пам'яті);
+сцени різного розміру - префікси однієї послідовності.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lab3'))
+
+from shapes.factory import ShapeFactory  # noqa: E402
+from utils.lod import LodRenderer  # noqa: E402
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError:
+    Image = None
+
+WIDTH, HEIGHT = 1000, 700
+
+
+def make_shapes(count: int, rng: random.Random):
+    shapes = []
+    types = ShapeFactory.shape_types()
+    for _ in range(count):
+        x, y = rng.randrange(WIDTH), rng.randrange(HEIGHT)
+        shape = ShapeFactory.create_shape(rng.choice(types), x, y)
+        size = rng.choice((1, 2, 4, 10, 40))
+        shape.update(x + rng.randint(-size, size), y + rng.randint(-size, size))
+        shapes.append(shape)
+    return shapes
+
+
+def build(count: int, shapes) -> LodRenderer:
+    lod = LodRenderer()
+    for shape in shapes[:count]:
+        lod.add(shape)
+    return lod
+
+
+def naive_render(lod: LodRenderer, draw) -> None:
+    for shape in lod.shapes:
+        shape.draw_raster(draw)
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - started) * 1e3, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Перемальовування з рівнями деталізації")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--naive-max', type=int, default=100_000,
+                        help="найбільша сцена, для якої міряти повне малювання")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    shapes = make_shapes(max(args.sizes), random.Random(args.seed))
+    build(1, shapes).plan(WIDTH, HEIGHT)  # NumPy імпортується ліниво - не в першому замірі
+    print(f"полотно {WIDTH}x{HEIGHT}, растр: {'Pillow' if Image else 'немає (лише план)'}")
+    print(f"{'фігур':>10}{'план, мс':>11}{'LOD, мс':>10}{'повне, мс':>11}"
+          f"{'фігур':>9}{'точок':>9}{'щільних':>9}")
+    for count in args.sizes:
+        lod = build(count, shapes)
+        plan_ms, plan = timed(lod.plan, WIDTH, HEIGHT)
+        lod_ms = naive_ms = float('nan')
+        if Image is not None:
+            draw = ImageDraw.Draw(Image.new('RGB', (WIDTH, HEIGHT), 'white'))
+            lod_ms, _ = timed(lod.render_raster, draw, WIDTH, HEIGHT)
+            if count <= args.naive_max:
+                draw = ImageDraw.Draw(Image.new('RGB', (WIDTH, HEIGHT), 'white'))
+                naive_ms, _ = timed(naive_render, lod, draw)
+        print(f"{count:>10,}{plan_ms:>11.1f}{lod_ms:>10.1f}{naive_ms:>11.1f}"
+              f"{len(plan.full):>9,}{len(plan.points):>9,}{len(plan.dense):>9,}")
+
+
+if __name__ == "__main__":
+    main()
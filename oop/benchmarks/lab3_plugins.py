@@ -0,0 +1,108 @@
+"""
+Вимірювання старту lab3 з плагінами фігур: лінивий реєстр проти імпорту всіх модулів
+Створює тимчасовий дистрибутив з N плагінами (група точок входу lab3.shapes),
+кожен замір - окремий чистий процес інтерпретатора.
+Запуск: python benchmarks/lab3_plugins.py [--plugins 0 10 100] [--runs 7]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+LAB3_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lab3')
+
+PLUGIN_MODULE = '''from shapes.base import Shape
+
+
+class PluginShape{n}(Shape):
+    def draw(self, canvas):
+        return canvas.create_rectangle(*self.coords(), outline='black', width=2)
+
+    def draw_rubber(self, canvas):
+        return canvas.create_rectangle(*self.coords(), outline='black', width=1)
+'''
+
+PROBE = '''
+import json, sys, time
+sys.path.insert(0, {plugins_dir!r})
+started = time.perf_counter()
+from shapes.factory import ShapeFactory
+from shapes.registry import ShapeRegistry
+if {eager}:
+    for name in ShapeRegistry.names():
+        ShapeRegistry.get(name)
+ShapeFactory.create_shape('point', 10, 10)
+startup = time.perf_counter()
+names = ShapeRegistry.names()
+discovered = time.perf_counter()
+if {count}:
+    ShapeFactory.create_shape('plugin0', 10, 10)
+first_plugin = time.perf_counter()
+print(json.dumps({{
+    'startup_ms': (startup - started) * 1e3,
+    'discover_ms': (discovered - startup) * 1e3,
+    'first_plugin_ms': (first_plugin - discovered) * 1e3,
+    'registered': len(names),
+    'loaded': len(ShapeRegistry.loaded()),
+}}))
+'''
+
+
+def make_plugins(root: str, count: int) -> str:
+    plugins_dir = os.path.join(root, f'plugins_{count}')
+    package = os.path.join(plugins_dir, 'lab3_shape_plugins')
+    dist_info = os.path.join(plugins_dir, 'lab3_shape_plugins-1.0.dist-info')
+    os.makedirs(package)
+    os.makedirs(dist_info)
+    open(os.path.join(package, '__init__.py'), 'w').close()
+    for n in range(count):
+        with open(os.path.join(package, f'plugin{n}.py'), 'w') as f:
+            f.write(PLUGIN_MODULE.format(n=n))
+    with open(os.path.join(dist_info, 'METADATA'), 'w') as f:
+        f.write("Metadata-Version: 2.1\nName: lab3-shape-plugins\nVersion: 1.0\n")
+    with open(os.path.join(dist_info, 'entry_points.txt'), 'w') as f:
+        f.write("[lab3.shapes]\n")
+        for n in range(count):
+            f.write(f"plugin{n} = lab3_shape_plugins.plugin{n}:PluginShape{n}\n")
+    return plugins_dir
+
+
+def measure(plugins_dir: str, count: int, eager: bool, runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(plugins_dir=plugins_dir, eager=eager, count=count)],
+            cwd=LAB3_DIR, capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(json.loads(output))
+    result = {key: statistics.median(s[key] for s in samples)
+              for key in ('startup_ms', 'discover_ms', 'first_plugin_ms')}
+    result['registered'] = samples[0]['registered']
+    result['loaded'] = samples[0]['loaded']
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Старт lab3 залежно від кількості плагінів фігур")
+    parser.add_argument('--plugins', type=int, nargs='+', default=[0, 10, 100])
+    parser.add_argument('--runs', type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'плагінів':>9}{'режим':>9}{'старт, мс':>12}{'пошук, мс':>12}"
+          f"{'1-й плагін, мс':>16}{'завантажено':>13}")
+    with tempfile.TemporaryDirectory() as root:
+        for count in args.plugins:
+            plugins_dir = make_plugins(root, count)
+            for eager in (False, True):
+                r = measure(plugins_dir, count, eager, args.runs)
+                print(f"{count:>9}{'всі' if eager else 'ліниво':>9}{r['startup_ms']:>12.2f}"
+                      f"{r['discover_ms']:>12.2f}{r['first_plugin_ms']:>16.2f}"
+                      f"{r['loaded']:>7}/{r['registered']:<5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Мікробенчмарк гумового сліду lab3: вартість однієї події <B1-Motion>
+Старий шлях: delete + create на кожну подію та два getattr; новий: coords() над одним елементом.
+Запуск: python benchmarks/lab3_rubber.py [--events 20000]
+З дисплеєм міряє справжнє tk.Canvas, без нього - RecordingCanvas, що лише записує виклики.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lab3'))
+
+from recording_canvas import RecordingCanvas  # noqa: E402
+from shapes.factory import ShapeFactory  # noqa: E402
+
+
+class Event:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def make_canvas():
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return RecordingCanvas(), None
+    canvas = tk.Canvas(root, width=800, height=600)
+    canvas.pack()
+    return canvas, root
+
+
+def old_gesture(shape, canvas, events):
+    """Поведінка до змін: getattr-диспетчеризація та пересоздання елемента на кожну подію"""
+    temp_id = None
+    for event in events:
+        getattr(shape, 'update', lambda x, y: None)(event.x, event.y)
+        if temp_id:
+            canvas.delete(temp_id)
+        temp_id = shape.draw_rubber(canvas)
+    canvas.delete(temp_id)
+
+
+def new_gesture(shape, canvas, events):
+    update = shape.update
+    show_rubber = shape.show_rubber
+    for event in events:
+        update(event.x, event.y)
+        show_rubber(canvas)
+    canvas.delete(shape.temp_id)
+
+
+def measure(gesture, shape_type, canvas, events) -> float:
+    shape = ShapeFactory.create_shape(shape_type, 100, 100)
+    started = time.perf_counter()
+    gesture(shape, canvas, events)
+    return (time.perf_counter() - started) / len(events) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Вартість події гумового сліду lab3")
+    parser.add_argument('--events', type=int, default=20_000)
+    args = parser.parse_args()
+
+    canvas, root = make_canvas()
+    events = [Event(100 + i % 500, 100 + (i * 7) % 400) for i in range(args.events)]
+    print(f"полотно: {'tk.Canvas' if root else 'RecordingCanvas (немає дисплея)'}, подій: {args.events:,}")
+    print(f"{'фігура':<12}{'старий, мкс':>14}{'новий, мкс':>14}{'прискорення':>14}{'подій/с':>14}")
+    for shape_type in ShapeFactory.shape_types():
+        old_us = measure(old_gesture, shape_type, canvas, events)
+        new_us = measure(new_gesture, shape_type, canvas, events)
+        print(f"{shape_type:<12}{old_us:>14.2f}{new_us:>14.2f}{old_us / new_us:>13.1f}x"
+              f"{1e6 / new_us:>14,.0f}")
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Безголове полотно для бенчмарків: записує виклики create_*/coords/delete замість малювання
+Повторює ту частину інтерфейсу tk.Canvas, якою користуються редактори lab2/lab3/lab4.
+"""
+
+from collections import Counter
+from typing import Dict, List, Tuple
+
+
+class RecordingCanvas:
+    """Заміна tk.Canvas без дисплея: видає номери елементів, зберігає їх координати й теги"""
+
+    def __init__(self, width: int = 1000, height: int = 700, record: bool = False):
+        self.width = width
+        self.height = height
+        self.record = record
+        self.calls: Counter = Counter()
+        self.log: List[Tuple] = []
+        self.items: Dict[int, list] = {}
+        self.tags: Dict[int, set] = {}
+        self.created = 0
+        self._next_id = 0
+        self._idle: list = []
+
+    # ---------- Створення ----------
+    def _create(self, kind: str, args, options) -> int:
+        self.calls[kind] += 1
+        self.created += 1
+        self._next_id += 1
+        item = self._next_id
+        coords = list(args[0]) if len(args) == 1 and isinstance(args[0], (list, tuple)) else list(args)
+        self.items[item] = coords
+        tags = options.get('tags', ())
+        self.tags[item] = {tags} if isinstance(tags, str) else set(tags)
+        if self.record:
+            self.log.append((kind, item, tuple(coords)))
+        return item
+
+    def create_line(self, *args, **options) -> int:
+        return self._create('create_line', args, options)
+
+    def create_oval(self, *args, **options) -> int:
+        return self._create('create_oval', args, options)
+
+    def create_rectangle(self, *args, **options) -> int:
+        return self._create('create_rectangle', args, options)
+
+    def create_polygon(self, *args, **options) -> int:
+        return self._create('create_polygon', args, options)
+
+    def create_image(self, *args, **options) -> int:
+        return self._create('create_image', args, options)
+
+    def create_text(self, *args, **options) -> int:
+        return self._create('create_text', args, options)
+
+    # ---------- Зміна та видалення ----------
+    def _resolve(self, tag_or_id) -> List[int]:
+        if tag_or_id == 'all':
+            return list(self.items)
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        return [item for item, tags in self.tags.items() if tag_or_id in tags]
+
+    def coords(self, item, *args):
+        self.calls['coords'] += 1
+        if not args:
+            return list(self.items.get(item, []))
+        coords = list(args[0]) if len(args) == 1 and isinstance(args[0], (list, tuple)) else list(args)
+        if item in self.items:
+            self.items[item] = coords
+        if self.record:
+            self.log.append(('coords', item, tuple(coords)))
+        return None
+
+    def delete(self, *tags_or_ids) -> None:
+        self.calls['delete'] += 1
+        for tag_or_id in tags_or_ids:
+            for item in self._resolve(tag_or_id):
+                del self.items[item]
+                del self.tags[item]
+                if self.record:
+                    self.log.append(('delete', item))
+
+    def itemconfigure(self, item, **options) -> None:
+        self.calls['itemconfigure'] += 1
+
+    itemconfig = itemconfigure
+
+    def addtag_withtag(self, new_tag: str, tag_or_id) -> None:
+        self.calls['addtag_withtag'] += 1
+        for item in self._resolve(tag_or_id):
+            self.tags[item].add(new_tag)
+
+    def tag_raise(self, *args) -> None:
+        self.calls['tag_raise'] += 1
+
+    def tag_lower(self, *args) -> None:
+        self.calls['tag_lower'] += 1
+
+    def find_all(self) -> Tuple[int, ...]:
+        return tuple(self.items)
+
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    # ---------- Планувальник ----------
+    def after_idle(self, func, *args) -> str:
+        self._idle.append((func, args))
+        return f"idle#{len(self._idle)}"
+
+    def run_idle(self) -> None:
+        pending, self._idle = self._idle, []
+        for func, args in pending:
+            func(*args)
+
+    # ---------- Статистика ----------
+    def item_count(self) -> int:
+        return len(self.items)
+
+    def reset_counters(self) -> None:
+        self.calls.clear()
+        self.log.clear()
+        self.created = 0
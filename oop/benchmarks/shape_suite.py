@@ -0,0 +1,198 @@
+"""
+Набір мікробенчмарків фігур lab2/lab3/lab4 на безголовому RecordingCanvas
+Для кожної фігури: вартість draw/draw_rubber і кількість створених елементів полотна;
+для кожного редактора: вартість повного перемальовування залежно від розміру сцени.
+Запуск: python benchmarks/shape_suite.py [--json results.json] [--compare baseline.json]
+З --compare повертає код 1, якщо медіана якогось заміру зросла більше ніж у --threshold разів.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+OOP_DIR = os.path.join(BENCH_DIR, '..')
+sys.path.insert(0, OOP_DIR)                        # lab3, lab4 - пакети
+sys.path.insert(0, os.path.join(OOP_DIR, 'lab2'))  # lab2.py імпортує сусідні модулі напряму
+
+from recording_canvas import RecordingCanvas  # noqa: E402
+
+import lab2 as lab2_editor  # noqa: E402
+from lab3.shapes.factory import ShapeFactory as Lab3Factory  # noqa: E402
+from lab3.utils.lod import LodRenderer  # noqa: E402
+from lab4.shapes.shape_factory import ShapeFactory as Lab4Factory  # noqa: E402
+
+WIDTH, HEIGHT = 1000, 700
+
+
+# ---------- Фабрики фігур кожного редактора ----------
+def lab2_shape(kind, x1, y1, x2, y2):
+    return lab2_editor.shape_view(kind, x1, y1, x2, y2)
+
+
+def lab3_shape(kind, x1, y1, x2, y2):
+    shape = Lab3Factory.create_shape(kind, x1, y1)
+    shape.update(x2, y2)
+    return shape
+
+
+def lab4_shape(kind, x1, y1, x2, y2):
+    shape = Lab4Factory.create(kind)
+    shape.set_coords(x1, y1, x2, y2)
+    return shape
+
+
+EDITORS = {
+    'lab2': (lab2_shape, {cls.__name__: kind for kind, cls in lab2_editor.SHAPE_TYPES.items()}),
+    'lab3': (lab3_shape, {name: name for name in Lab3Factory.shape_types()}),
+    'lab4': (lab4_shape, {cls.__name__: name for name, cls in Lab4Factory._map.items()}),
+}
+
+
+def random_box(rng: random.Random):
+    x, y = rng.randint(50, WIDTH - 50), rng.randint(50, HEIGHT - 50)
+    return x, y, x + rng.randint(-40, 40), y + rng.randint(-40, 40)
+
+
+def scene(editor: str, count: int, rng: random.Random):
+    make, kinds = EDITORS[editor]
+    kinds = list(kinds.values())
+    return [make(rng.choice(kinds), *random_box(rng)) for _ in range(count)]
+
+
+# ---------- Вимірювання ----------
+def bench(setup, run, rounds: int, inner: int) -> dict:
+    """Як pytest-benchmark: rounds повторів по inner викликів, статистика на один виклик (мкс)"""
+    samples = []
+    canvas = None
+    for _ in range(rounds):
+        canvas, state = setup()
+        started = time.perf_counter()
+        for _ in range(inner):
+            run(canvas, state)
+        samples.append((time.perf_counter() - started) / inner * 1e6)
+    return {
+        'min_us': min(samples),
+        'median_us': statistics.median(samples),
+        'mean_us': statistics.fmean(samples),
+        'stddev_us': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'rounds': rounds,
+        'iterations': inner,
+        'items_per_call': canvas.created / inner,
+    }
+
+
+def shape_cases(rounds: int, inner: int):
+    box = (120, 140, 180, 200)
+    for editor, (make, kinds) in EDITORS.items():
+        for label, kind in kinds.items():
+            shape = make(kind, *box)
+            yield f"draw/{editor}/{label}", bench(
+                lambda: (RecordingCanvas(), None), lambda c, _: shape.draw(c), rounds, inner)
+            yield f"rubber/{editor}/{label}", bench(
+                lambda: (RecordingCanvas(), None), lambda c, _: shape.draw_rubber(c), rounds, inner)
+
+
+def lab3_rubber_cases(rounds: int, inner: int):
+    """Гумовий слід lab3 у жесті: перший виклик створює елемент, далі лише coords()"""
+    for kind in Lab3Factory.shape_types():
+        def setup(kind=kind):
+            canvas = RecordingCanvas()
+            shape = Lab3Factory.create_shape(kind, 100, 100)
+            shape.show_rubber(canvas)
+            canvas.reset_counters()
+            return canvas, shape
+
+        def run(canvas, shape):
+            shape.update(160, 170)
+            shape.show_rubber(canvas)
+        yield f"gesture/lab3/{kind}", bench(setup, run, rounds, inner)
+
+
+def redraw_cases(sizes, rounds: int):
+    rng = random.Random(1)
+    for size in sizes:
+        for editor in EDITORS:
+            shapes = scene(editor, size, rng)
+
+            def run(canvas, shapes=shapes):
+                canvas.delete('all')
+                for shape in shapes:
+                    shape.draw(canvas)
+            yield f"redraw/{editor}/{size}", bench(
+                lambda: (RecordingCanvas(), None), lambda c, _, run=run: run(c), rounds, 1)
+
+        lod = LodRenderer()
+        for shape in scene('lab3', size, rng):
+            lod.add(shape)
+        yield f"redraw/lab3-lod/{size}", bench(
+            lambda: (RecordingCanvas(), None),
+            lambda c, _: lod.render_canvas(c, WIDTH, HEIGHT), rounds, 1)
+
+
+# ---------- Звіт ----------
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=OOP_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def compare(results: dict, baseline_path: str, threshold: float) -> bool:
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)['benchmarks']
+    regressed = False
+    for name, stats in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        ratio = stats['median_us'] / old['median_us'] if old['median_us'] else 1.0
+        if ratio > threshold:
+            print(f"  РЕГРЕСІЯ: {name}: {old['median_us']:.2f} -> {stats['median_us']:.2f} мкс (x{ratio:.2f})")
+            regressed = True
+    return regressed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Мікробенчмарки фігур lab2/lab3/lab4")
+    parser.add_argument('--rounds', type=int, default=7)
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1_000, 10_000])
+    parser.add_argument('--json', help="куди записати результати")
+    parser.add_argument('--compare', help="JSON попереднього запуску для порівняння")
+    parser.add_argument('--threshold', type=float, default=1.25)
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'замір':<36}{'медіана, мкс':>14}{'мін, мкс':>12}{'елементів':>11}")
+    for cases in (shape_cases(args.rounds, args.iterations),
+                  lab3_rubber_cases(args.rounds, args.iterations),
+                  redraw_cases(args.sizes, args.rounds)):
+        for name, stats in cases:
+            results[name] = stats
+            print(f"{name:<36}{stats['median_us']:>14.2f}{stats['min_us']:>12.2f}"
+                  f"{stats['items_per_call']:>11.1f}")
+
+    if args.json:
+        report = {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'benchmarks': results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Пакетний (headless) режим калькулятора
+Відтворює записані сесії натискань кнопок без Tk, сесії паралеляться між процесами
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, List, Optional, Sequence
+
+from core import CalculatorEngine, CalculatorState, NumberSystemRegistry
+
+
+def apply_tokens(engine: CalculatorEngine, tokens: Iterable[str]):
+    """Подає токени в двигун так само, як це роблять кнопки та радіокнопки GUI
+
+    Токени - це написи кнопок ('7', '+', '=', '1/X', ...) або коди режимів
+    ('DEC', 'BIN', 'HEX', ...), які перемикають систему числення.
+    """
+    press = engine.press
+    for token in tokens:
+        if NumberSystemRegistry.has(token):
+            engine.change_number_system(NumberSystemRegistry.get(token))
+        else:
+            press(token)
+
+
+def run_session(tokens: Iterable[str], mode: str = 'DEC') -> str:
+    """Виконує одну сесію і повертає фінальний вміст дисплею"""
+    state = CalculatorState()
+    engine = CalculatorEngine(state)
+    if mode != 'DEC':
+        engine.change_number_system(NumberSystemRegistry.get(mode))
+    apply_tokens(engine, tokens)
+    return state.current_value
+
+
+def _run_chunk(sessions: List[Sequence[str]]) -> List[str]:
+    """Обробка пачки сесій в одному процесі"""
+    return [run_session(tokens) for tokens in sessions]
+
+
+def _chunks(items: Iterable, size: int):
+    """Розбиття ітерованого об'єкта на списки фіксованого розміру"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map_sessions(pool: ProcessPoolExecutor, sessions: Iterable[Sequence[str]],
+                  chunksize: int) -> List[str]:
+    results: List[str] = []
+    for displays in pool.map(_run_chunk, _chunks(sessions, chunksize)):
+        results.extend(displays)
+    return results
+
+
+def run_sessions(sessions: Iterable[Sequence[str]], workers: Optional[int] = None,
+                 chunksize: int = 512) -> List[str]:
+    """Виконує багато незалежних сесій, повертає дисплеї в тому ж порядку
+
+    workers=1 виконує все в поточному процесі; інакше сесії групуються
+    по chunksize і розподіляються між процесами пулу.
+    """
+    if workers == 1:
+        return [run_session(tokens) for tokens in sessions]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _map_sessions(pool, sessions, chunksize)
+
+
+def parse_session(line: str) -> List[str]:
+    """Рядок журналу -> список токенів (розділювач - пробіл)"""
+    return line.split()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Пакетне відтворення сесій калькулятора")
+    parser.add_argument('input', help="файл сесій, одна сесія на рядок")
+    parser.add_argument('-o', '--output', help="файл результатів (за замовчуванням stdout)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="кількість процесів")
+    parser.add_argument('--batch', type=int, default=100_000,
+                        help="скільки сесій читати з файлу за раз")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        with open(args.input, encoding='utf-8') as f, \
+                ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for lines in _chunks(f, args.batch):
+                sessions = [parse_session(line) for line in lines]
+                displays = _map_sessions(pool, sessions, 512)
+                out.write('\n'.join(displays))
+                out.write('\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
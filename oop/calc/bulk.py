@@ -0,0 +1,58 @@
+"""
+Потокова конвертація файлів між системами числення
+Файл обробляється блоками по межах рядків, без завантаження цілком
+"""
+
+import argparse
+import sys
+from typing import Iterable, List, Optional
+
+from core import NumberSystemRegistry
+
+
+def _read_chunks(stream, chunk_size: int) -> Iterable[bytes]:
+    """Блоки файлу, що закінчуються на межі рядка"""
+    tail = b''
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        block = tail + block
+        cut = block.rfind(b'\n') + 1
+        if cut == 0:
+            tail = block
+            continue
+        tail = block[cut:]
+        yield block[:cut]
+    if tail:
+        yield tail
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    modes = [mode for _, mode in NumberSystemRegistry.modes()]
+    parser = argparse.ArgumentParser(description="Потокова конвертація файлу між системами числення")
+    parser.add_argument('source', choices=modes, help="система числення вхідного файлу")
+    parser.add_argument('target', choices=modes, help="система числення результату")
+    parser.add_argument('input', help="вхідний файл, одне число на рядок ('-' для stdin)")
+    parser.add_argument('-o', '--output', help="файл результату (за замовчуванням stdout)")
+    parser.add_argument('--chunk-size', type=int, default=8 << 20, help="розмір блоку в байтах")
+    args = parser.parse_args(argv)
+
+    source = NumberSystemRegistry.get(args.source)
+    target = NumberSystemRegistry.get(args.target)
+
+    src = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    dst = open(args.output, 'wb') if args.output else sys.stdout.buffer
+    try:
+        for chunk in _read_chunks(src, args.chunk_size):
+            dst.write(target.from_decimal_many(source.to_decimal_many(chunk)))
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+from .number_systems import (NumberSystem, BaseNSystem, DecimalSystem, BinarySystem,
+                             HexadecimalSystem, NumberSystemRegistry, DIGITS, INVALID_DIGIT,
+                             digit_table)
+from .operations import (Number, OperationType, BUTTON_OPERATIONS, Operation, AddOperation,
+                         SubtractOperation, MultiplyOperation, DivideOperation, OperationFactory)
+from .state import CalculatorState
+from .engine import CalculatorEngine, TEXT_TOKENS
+from .tape import CalculationTape, TapeEntry
+
+__all__ = [
+    "NumberSystem", "BaseNSystem", "DecimalSystem", "BinarySystem", "HexadecimalSystem",
+    "NumberSystemRegistry", "DIGITS", "INVALID_DIGIT", "digit_table",
+    "Number", "OperationType", "BUTTON_OPERATIONS", "Operation", "AddOperation",
+    "SubtractOperation", "MultiplyOperation", "DivideOperation", "OperationFactory",
+    "CalculatorState", "CalculatorEngine", "TEXT_TOKENS", "CalculationTape", "TapeEntry",
+]
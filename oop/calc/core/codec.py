@@ -0,0 +1,216 @@
+"""
+Пакетна конвертація між системами числення
+Декодування цифр через 256-елементні таблиці та NumPy
+"""
+
+from functools import lru_cache
+from typing import Callable, Union
+
+from .number_systems import DIGITS, INVALID_DIGIT, digit_table
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий - тоді працює поелементний шлях
+    np = None
+
+
+NEWLINE = 0x0A
+# Префікси, які приймає int(value, base) і які дають bin()/hex() для від'ємних
+PREFIXES = {2: ord('b'), 8: ord('o'), 16: ord('x')}
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+@lru_cache(maxsize=None)
+def max_int64_digits(base: int) -> int:
+    """Скільки цифр основи base гарантовано вміщується в int64"""
+    digits = 0
+    while base ** (digits + 1) <= 2 ** 63:
+        digits += 1
+    return digits
+
+
+@lru_cache(maxsize=None)
+def _np_tables(base: int):
+    """NumPy-версії таблиць декодування та кодування"""
+    return (np.frombuffer(digit_table(base), dtype=np.uint8),
+            np.frombuffer(DIGITS[:base].encode('ascii'), dtype=np.uint8))
+
+
+def _split_lines(data: Buffer):
+    """Буфер -> (масив байтів, початки рядків, довжини рядків) без копіювання рядків"""
+    arr = np.frombuffer(data, dtype=np.uint8)
+    ends = np.flatnonzero(arr == NEWLINE)
+    if arr.size and arr[-1] != NEWLINE:
+        ends = np.append(ends, arr.size)
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts
+    # Windows-переведення рядка
+    has_cr = lengths > 0
+    has_cr[has_cr] = arr[ends[has_cr] - 1] == ord('\r')
+    lengths -= has_cr
+    return arr, starts, lengths
+
+
+def _decode_matrix(codes, lengths, negative, base: int, rows=None):
+    """Схема Горнера по стовпцях матриці кодів символів (рядки вирівняні вліво)
+
+    rows - номери рядків у вхідних даних, якщо матриця містить лише їх частину.
+    """
+    width = int(lengths.max()) if lengths.size else 0
+    table, _ = _np_tables(base)
+    digits = table[codes]
+    inside = np.arange(width) < lengths[:, None]
+    bad = (digits == INVALID_DIGIT) & inside
+    if bad.any():
+        row = int(np.flatnonzero(bad.any(axis=1))[0])
+        if rows is not None:
+            row = int(rows[row])
+        raise ValueError(f"Неприпустимий символ для основи {base} у рядку {row + 1}")
+
+    result = np.zeros(len(lengths), dtype=np.int64)
+    for col in range(width):
+        step = inside[:, col]
+        result[step] = result[step] * base + digits[step, col]
+    return np.where(negative, -result, result)
+
+
+def _starts_with(arr, starts, lengths, char: int):
+    mask = lengths > 0
+    mask[mask] = arr[starts[mask]] == char
+    return mask
+
+
+def _gather(arr, starts, lengths):
+    """Матриця кодів символів: рядок i - arr[starts[i]:starts[i] + lengths[i]], вирівняний вліво"""
+    width = int(lengths.max()) if lengths.size else 0
+    index = starts[:, None] + np.arange(width)
+    np.minimum(index, arr.size - 1, out=index)
+    return arr[index]
+
+
+def _decode_wide(arr, starts, lengths, negative, wide, base: int):
+    """Є рядки, ширші за int64: вони декодуються поелементно через int(), решта - матрицею
+
+    Результат - масив dtype=object з цілими Python довільної довжини.
+    """
+    result = np.empty(len(starts), dtype=object)
+    narrow = np.flatnonzero(~wide)
+    if narrow.size:
+        result[narrow] = _decode_matrix(_gather(arr, starts[narrow], lengths[narrow]),
+                                        lengths[narrow], negative[narrow], base, rows=narrow).tolist()
+
+    table, _ = _np_tables(base)
+    for row in np.flatnonzero(wide).tolist():
+        codes = arr[starts[row]:starts[row] + lengths[row]]
+        if (table[codes] == INVALID_DIGIT).any():
+            raise ValueError(f"Неприпустимий символ для основи {base} у рядку {row + 1}")
+        value = int(codes.tobytes(), base)
+        result[row] = -value if negative[row] else value
+    return result
+
+
+def _decode_rows(arr, starts, lengths, base: int):
+    """Рядок i - це arr[starts[i]:starts[i] + lengths[i]]; знак і префікс 0b/0o/0x відкидаються"""
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64)
+    negative = _starts_with(arr, starts, lengths, ord('-'))
+    starts = starts + negative
+    lengths = lengths - negative
+    sign_only = negative & (lengths == 0)
+    if sign_only.any():
+        row = int(np.flatnonzero(sign_only)[0])
+        raise ValueError(f"Знак без цифр у рядку {row + 1}")
+
+    prefix = PREFIXES.get(base)
+    if prefix is not None:
+        has_prefix = _starts_with(arr, starts, lengths, ord('0')) & (lengths > 2)
+        has_prefix[has_prefix] = (arr[starts[has_prefix] + 1] | 0x20) == prefix
+        starts = starts + 2 * has_prefix
+        lengths = lengths - 2 * has_prefix
+
+    wide = lengths > max_int64_digits(base)
+    if wide.any():
+        return _decode_wide(arr, starts, lengths, negative, wide, base)
+    return _decode_matrix(_gather(arr, starts, lengths), lengths, negative, base)
+
+
+def _decode_buffer(data: Buffer, base: int):
+    return _decode_rows(*_split_lines(data), base)
+
+
+def _decode_bytes_array(values, base: int):
+    """Масив dtype='S' (доповнений нулями праворуч) -> int64"""
+    width = values.dtype.itemsize
+    codes = np.ascontiguousarray(values).view(np.uint8).reshape(len(values), width)
+    lengths = (codes != 0).sum(axis=1)
+    starts = np.arange(len(values)) * width
+    return _decode_rows(codes.ravel(), starts, lengths, base)
+
+
+def decode_many(values, base: int):
+    """Рядки в основі base -> десяткові числа
+
+    values - буфер байтів із рядками через '\\n', NumPy-масив рядків
+    або будь-який ітерований об'єкт рядків. Порожній рядок дає 0.
+    З NumPy повертає масив int64 (dtype=object, якщо є рядки, ширші за int64),
+    без нього - список int.
+    """
+    if np is None:
+        if isinstance(values, (bytes, bytearray, memoryview)):
+            values = bytes(values).splitlines()
+        return [int(value, base) if value else 0 for value in values]
+
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        return _decode_buffer(values, base)
+    values = np.asarray(values)
+    if values.dtype.kind != 'S':
+        values = values.astype('S')
+    return _decode_bytes_array(values, base)
+
+
+def encode_many(values, base: int, fallback: Callable[[int], str]) -> bytes:
+    """Десяткові числа -> рядки в основі base, кожен завершується '\\n'
+
+    Невід'ємні числа кодуються векторно через таблицю цифр;
+    якщо є від'ємні (їх формат залежить від системи), використовується fallback.
+    """
+    if np is None:
+        return b''.join(fallback(int(value)).encode('ascii') + b'\n' for value in values)
+
+    values = np.asarray(values)
+    if values.dtype == object:
+        # цілі, ширші за int64 - лише поелементно
+        return b''.join(fallback(int(value)).encode('ascii') + b'\n' for value in values.tolist())
+    values = values.astype(np.int64, copy=False)
+    if values.size == 0:
+        return b''
+    if (values < 0).any():
+        return b''.join(fallback(int(value)).encode('ascii') + b'\n' for value in values.tolist())
+
+    _, alphabet = _np_tables(base)
+    maximum = int(values.max())
+    width = 1
+    while base ** width <= maximum:
+        width += 1
+
+    # Цифри від старшої до молодшої + стовпець для '\n'
+    digits = np.empty((values.size, width + 1), dtype=np.uint8)
+    rest = values.copy()
+    for col in range(width - 1, -1, -1):
+        rest, digit = np.divmod(rest, base)
+        digits[:, col] = digit
+    chars = alphabet[digits[:, :width]]
+
+    # Відкидаємо ведучі нулі, але завжди лишаємо останню цифру
+    significant = np.maximum.accumulate(digits[:, :width] != 0, axis=1)
+    significant[:, -1] = True
+    out = np.empty_like(digits)
+    out[:, :width] = chars
+    out[:, width] = NEWLINE
+    keep = np.empty(digits.shape, dtype=bool)
+    keep[:, :width] = significant
+    keep[:, width] = True
+    return out[keep].tobytes()
@@ -0,0 +1,216 @@
+"""
+Двигун калькулятора - бізнес-логіка без жодної залежності від GUI
+"""
+
+import math
+from decimal import Decimal, DecimalException
+from typing import Optional
+
+from .exact import EXACT_CONTEXT, format_exact, parse_exact, to_exact
+from .number_systems import DecimalSystem, NumberSystem
+from .operations import BUTTON_OPERATIONS, Number, OperationFactory, OperationType
+from .state import CalculatorState
+from .tape import CalculationTape
+
+
+# Символи клавіатури/буфера обміну, що відповідають кнопкам
+TEXT_TOKENS = {
+    '*': '×',
+    ',': '.',
+    '\n': '=',
+    '\r': '=',
+}
+
+
+# ==================== ОБЧИСЛЮВАЛЬНА ЛОГІКА ====================
+class CalculatorEngine:
+    """Двигун калькулятора - бізнес-логіка"""
+    
+    def __init__(self, state: CalculatorState, tape: Optional[CalculationTape] = None):
+        self._state = state
+        self._tape = tape
+    
+    def input_digit(self, digit: str):
+        """Введення цифри"""
+        if not self._state.number_system.validate(digit):
+            return
+        
+        if self._state.is_new_number:
+            self._state.current_value = digit
+            self._state.is_new_number = False
+        else:
+            if len(self._state.current_value) < self._state.number_system.get_max_digits():
+                if self._state.current_value == "0":
+                    self._state.current_value = digit
+                else:
+                    self._state.current_value += digit
+    
+    def input_decimal(self):
+        """Додавання десяткової крапки"""
+        if not isinstance(self._state.number_system, DecimalSystem):
+            return
+        
+        if self._state.is_new_number:
+            self._state.current_value = "0."
+            self._state.is_new_number = False
+        elif "." not in self._state.current_value:
+            self._state.current_value += "."
+    
+    def set_operation(self, operation: OperationType):
+        """Встановлення операції"""
+        if self._state.stored_value is not None and not self._state.is_new_number:
+            self.calculate()
+        
+        try:
+            self._state.stored_value = self._convert_to_decimal()
+            self._state.operation = operation
+            self._state.is_new_number = True
+        except (ValueError, DecimalException):
+            self._state.current_value = "Помилка"
+    
+    def calculate(self):
+        """Виконання обчислення"""
+        if self._state.stored_value is None or self._state.operation == OperationType.NONE:
+            return
+        
+        entry = None
+        try:
+            current = self._convert_to_decimal()
+            operation = OperationFactory.get_operation(self._state.operation)
+            
+            if operation:
+                stored = self._state.stored_value
+                if type(stored) is int and type(current) is int:
+                    result = operation.execute_int(stored, current)
+                elif self._state.exact:
+                    result = operation.execute_exact(to_exact(stored), to_exact(current), EXACT_CONTEXT)
+                else:
+                    result = operation.execute(stored, current)
+                self._state.current_value = self._convert_from_decimal(result)
+                entry = (self._state.operation, stored, current, result)
+            
+            self._state.stored_value = None
+            self._state.operation = OperationType.NONE
+            self._state.is_new_number = True
+        except (ValueError, ZeroDivisionError, DecimalException):
+            self._state.current_value = "Помилка"
+            self._state.reset()
+            return
+        
+        # Запис у стрічку - лише після повного оновлення стану
+        if entry is not None and self._tape is not None:
+            self._tape.append(*entry)
+    
+    def reciprocal(self):
+        """Обчислення 1/X"""
+        try:
+            value = self._convert_to_decimal()
+            if value == 0:
+                raise ValueError("Ділення на нуль")
+            divide = OperationFactory.get_operation(OperationType.DIVIDE)
+            if type(value) is int:
+                result = divide.execute_int(1, value)
+            elif type(value) is Decimal:
+                result = divide.execute_exact(Decimal(1), value, EXACT_CONTEXT)
+            else:
+                result = 1 / value
+            self._state.current_value = self._convert_from_decimal(result)
+            self._state.is_new_number = True
+        except (ValueError, ZeroDivisionError, DecimalException):
+            self._state.current_value = "Помилка"
+    
+    def negate(self):
+        """Зміна знаку"""
+        try:
+            value = self._convert_to_decimal()
+            result = -value
+            self._state.current_value = self._convert_from_decimal(result)
+        except ValueError:
+            pass
+    
+    def backspace(self):
+        """Видалення останнього символу"""
+        if len(self._state.current_value) > 1:
+            self._state.current_value = self._state.current_value[:-1]
+        else:
+            self._state.current_value = "0"
+            self._state.is_new_number = True
+    
+    def clear(self):
+        """Очищення"""
+        self._state.reset()
+    
+    def press(self, button_text: str):
+        """Обробка однієї кнопки (спільна для GUI та пакетного режиму)"""
+        if button_text.isdigit():
+            self.input_digit(button_text)
+        elif button_text == '.':
+            self.input_decimal()
+        elif button_text == 'C':
+            self.clear()
+        elif button_text == '←':
+            self.backspace()
+        elif button_text == '±':
+            self.negate()
+        elif button_text == '1/X':
+            self.reciprocal()
+        elif button_text == '=':
+            self.calculate()
+        elif button_text in BUTTON_OPERATIONS:
+            self.set_operation(BUTTON_OPERATIONS[button_text])
+    
+    def input_text(self, text: str):
+        """Пакетне введення тексту (клавіатура, вставка з буфера обміну)
+
+        Літери завжди трактуються як цифри (у HEX 'C' - це цифра, а не очищення).
+        """
+        press = self.press
+        for char in text:
+            char = TEXT_TOKENS.get(char, char)
+            if char in BUTTON_OPERATIONS or char in '.=':
+                press(char)
+            elif not char.isspace():
+                self.input_digit(char.upper())
+    
+    def set_exact_mode(self, enabled: bool):
+        """Перемикання точного режиму; відкладений операнд переводиться в новий тип"""
+        self._state.exact = enabled
+        stored = self._state.stored_value
+        if enabled and type(stored) is float:
+            self._state.stored_value = to_exact(stored)
+        elif not enabled and type(stored) is Decimal:
+            self._state.stored_value = float(stored)
+    
+    def change_number_system(self, system: NumberSystem):
+        """Зміна системи числення"""
+        try:
+            decimal_value = self._convert_to_decimal()
+            self._state.number_system = system
+            self._state.current_value = self._convert_from_decimal(decimal_value)
+        except ValueError:
+            self._state.number_system = system
+            self._state.current_value = "0"
+    
+    def _convert_to_decimal(self) -> Number:
+        """Конвертація в десяткове число (int для недесяткових систем)"""
+        if isinstance(self._state.number_system, DecimalSystem):
+            if self._state.exact:
+                return parse_exact(self._state.current_value)
+            return float(self._state.current_value)
+        else:
+            return self._state.number_system.to_decimal(self._state.current_value)
+    
+    def _convert_from_decimal(self, value: Number) -> str:
+        """Конвертація з десяткового числа"""
+        if isinstance(self._state.number_system, DecimalSystem):
+            if type(value) is int:
+                return str(value)
+            if type(value) is Decimal:
+                return format_exact(value)
+            # Видалення зайвих нулів
+            result = f"{value:.10f}".rstrip('0').rstrip('.')
+            return result if result != '-0' else '0'
+        else:
+            if type(value) is float and not math.isfinite(value):
+                raise ValueError(f"{value} не має цілого подання")
+            return self._state.number_system.from_decimal(int(value))
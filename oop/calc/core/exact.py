@@ -0,0 +1,39 @@
+"""
+Точний десятковий режим: decimal.Decimal зі спільним контекстом та швидке форматування
+"""
+
+from decimal import Context, Decimal, DivisionByZero, InvalidOperation, Overflow, ROUND_HALF_EVEN
+
+# Один контекст на весь процес: операції викликаються як його методи, без localcontext()
+EXACT_CONTEXT = Context(prec=28, rounding=ROUND_HALF_EVEN,
+                        traps=[InvalidOperation, DivisionByZero, Overflow])
+
+
+def parse_exact(text: str) -> Decimal:
+    """Рядок дисплею -> скінченний Decimal (ValueError для некоректного вводу, inf та nan)"""
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Некоректне число: {text!r}") from None
+    if not value.is_finite():
+        raise ValueError(f"Точний режим не працює з {text!r}")
+    return value
+
+
+def to_exact(value) -> Decimal:
+    """int/float/Decimal -> Decimal; float береться за коротким repr (0.1 -> 0.1)"""
+    if type(value) is Decimal:
+        return value
+    if type(value) is float:
+        return Decimal(repr(value))
+    return Decimal(value)
+
+
+def format_exact(value: Decimal) -> str:
+    """Decimal -> рядок дисплею без експоненти та зайвих нулів"""
+    if not value:
+        return '0'
+    text = format(value, 'f')
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    return text
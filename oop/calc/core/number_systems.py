@@ -0,0 +1,165 @@
+"""
+Системи числення: абстракція, табличні системи з основою 2..36 та їх реєстр
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+
+# ==================== АБСТРАКЦІЯ ====================
+class NumberSystem(ABC):
+    """Абстрактний базовий клас для системи числення"""
+    
+    @abstractmethod
+    def to_decimal(self, value: str) -> int:
+        """Конвертує з поточної системи в десяткову"""
+        pass
+    
+    @abstractmethod
+    def from_decimal(self, value: int) -> str:
+        """Конвертує з десяткової в поточну систему"""
+        pass
+    
+    @abstractmethod
+    def validate(self, char: str) -> bool:
+        """Перевіряє чи символ валідний для системи"""
+        pass
+    
+    @abstractmethod
+    def get_max_digits(self) -> int:
+        """Максимальна кількість цифр"""
+        pass
+    
+    @abstractmethod
+    def get_base(self) -> int:
+        """Основа системи числення"""
+        pass
+    
+    def to_decimal_many(self, values):
+        """Пакетна конвертація рядків (буфер байтів або масив NumPy) в десяткові числа"""
+        from .codec import decode_many
+        return decode_many(values, self.get_base())
+    
+    def from_decimal_many(self, values) -> bytes:
+        """Пакетна конвертація чисел у рядки, розділені '\\n'"""
+        from .codec import encode_many
+        return encode_many(values, self.get_base(), self.from_decimal)
+
+
+# ==================== ТАБЛИЦІ ЦИФР ====================
+DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+INVALID_DIGIT = 0xFF
+
+
+def digit_table(base: int) -> bytes:
+    """Таблиця на 256 байтів: код символу -> значення цифри (INVALID_DIGIT якщо не цифра)"""
+    table = bytearray([INVALID_DIGIT]) * 256
+    for value, char in enumerate(DIGITS[:base]):
+        table[ord(char)] = value
+        table[ord(char.lower())] = value
+    return bytes(table)
+
+
+# ==================== НАСЛІДУВАННЯ та ПОЛІМОРФІЗМ ====================
+class BaseNSystem(NumberSystem):
+    """Узагальнена система числення з основою 2..36 на готових таблицях"""
+    
+    def __init__(self, base: int, max_digits: int):
+        if not 2 <= base <= len(DIGITS):
+            raise ValueError(f"Непідтримувана основа: {base}")
+        self._base = base
+        self._max_digits = max_digits
+        self._digits = DIGITS[:base]
+        self._table = digit_table(base)
+    
+    def to_decimal(self, value: str) -> int:
+        return int(value, self._base) if value else 0
+    
+    def from_decimal(self, value: int) -> str:
+        if value == 0:
+            return '0'
+        sign = '-' if value < 0 else ''
+        value = abs(value)
+        digits = self._digits
+        base = self._base
+        chars = []
+        while value:
+            value, digit = divmod(value, base)
+            chars.append(digits[digit])
+        return sign + ''.join(reversed(chars))
+    
+    def validate(self, char: str) -> bool:
+        return len(char) == 1 and ord(char) < 256 and self._table[ord(char)] != INVALID_DIGIT
+    
+    def get_max_digits(self) -> int:
+        return self._max_digits
+    
+    def get_base(self) -> int:
+        return self._base
+
+
+class DecimalSystem(BaseNSystem):
+    """Десяткова система числення"""
+    
+    def __init__(self):
+        super().__init__(10, 15)
+    
+    def from_decimal(self, value: int) -> str:
+        return str(value)
+    
+    def validate(self, char: str) -> bool:
+        return char == '.' or super().validate(char)
+
+
+class BinarySystem(BaseNSystem):
+    """Двійкова система числення"""
+    
+    def __init__(self):
+        super().__init__(2, 32)
+    
+    def from_decimal(self, value: int) -> str:
+        return bin(value)[2:] if value >= 0 else bin(value)
+
+
+class HexadecimalSystem(BaseNSystem):
+    """Шістнадцяткова система числення"""
+    
+    def __init__(self):
+        super().__init__(16, 8)
+    
+    def from_decimal(self, value: int) -> str:
+        return hex(value)[2:].upper() if value >= 0 else hex(value)
+
+
+# ==================== РЕЄСТР систем числення ====================
+class NumberSystemRegistry:
+    """Реєстр спільних екземплярів систем числення за кодом режиму"""
+    
+    _systems = {}
+    _labels = {}
+    
+    @classmethod
+    def register(cls, mode: str, system: NumberSystem, label: str):
+        cls._systems[mode] = system
+        cls._labels[mode] = label
+    
+    @classmethod
+    def get(cls, mode: str) -> NumberSystem:
+        return cls._systems[mode]
+    
+    @classmethod
+    def has(cls, mode: str) -> bool:
+        return mode in cls._systems
+    
+    @classmethod
+    def modes(cls) -> List[Tuple[str, str]]:
+        """Пари (назва, код режиму) у порядку реєстрації"""
+        return [(cls._labels[mode], mode) for mode in cls._systems]
+
+
+NumberSystemRegistry.register('DEC', DecimalSystem(), "Десяткова")
+NumberSystemRegistry.register('BIN', BinarySystem(), "Двійкова")
+NumberSystemRegistry.register('HEX', HexadecimalSystem(), "Шістнадцяткова")
+NumberSystemRegistry.register('OCT', BaseNSystem(8, 11), "Вісімкова")
+NumberSystemRegistry.register('B32', BaseNSystem(32, 7), "32-кова")
+NumberSystemRegistry.register('B36', BaseNSystem(36, 7), "36-кова")
@@ -0,0 +1,117 @@
+"""
+Типи операцій та їх стратегії
+"""
+
+from abc import ABC, abstractmethod
+from decimal import Context, Decimal
+from enum import Enum
+from typing import Optional, Union
+
+
+# Операнд: float (або Decimal у точному режимі) для десяткової системи, int для решти систем
+Number = Union[int, float, Decimal]
+
+
+# ==================== ENUM для типів операцій ====================
+class OperationType(Enum):
+    """Перелік типів операцій"""
+    ADD = "+"
+    SUBTRACT = "-"
+    MULTIPLY = "×"
+    DIVIDE = "/"
+    NONE = ""
+
+
+# Відповідність кнопок операціям
+BUTTON_OPERATIONS = {
+    '+': OperationType.ADD,
+    '-': OperationType.SUBTRACT,
+    '×': OperationType.MULTIPLY,
+    '/': OperationType.DIVIDE,
+}
+
+
+# ==================== СТРАТЕГІЯ для операцій ====================
+class Operation(ABC):
+    """Абстрактний клас для операцій (патерн Стратегія)"""
+    
+    @abstractmethod
+    def execute(self, a: float, b: float) -> float:
+        pass
+    
+    def execute_int(self, a: int, b: int) -> int:
+        """Цілочисельний варіант для BIN/HEX (без переходу через float)"""
+        return int(self.execute(a, b))
+    
+    def execute_exact(self, a: Decimal, b: Decimal, context: Context) -> Decimal:
+        """Точний варіант на Decimal зі спільним контекстом"""
+        return self.execute(a, b)
+
+
+class AddOperation(Operation):
+    def execute(self, a: float, b: float) -> float:
+        return a + b
+    
+    def execute_int(self, a: int, b: int) -> int:
+        return a + b
+    
+    def execute_exact(self, a: Decimal, b: Decimal, context: Context) -> Decimal:
+        return context.add(a, b)
+
+
+class SubtractOperation(Operation):
+    def execute(self, a: float, b: float) -> float:
+        return a - b
+    
+    def execute_int(self, a: int, b: int) -> int:
+        return a - b
+    
+    def execute_exact(self, a: Decimal, b: Decimal, context: Context) -> Decimal:
+        return context.subtract(a, b)
+
+
+class MultiplyOperation(Operation):
+    def execute(self, a: float, b: float) -> float:
+        return a * b
+    
+    def execute_int(self, a: int, b: int) -> int:
+        return a * b
+    
+    def execute_exact(self, a: Decimal, b: Decimal, context: Context) -> Decimal:
+        return context.multiply(a, b)
+
+
+class DivideOperation(Operation):
+    def execute(self, a: float, b: float) -> float:
+        # b може бути масивом NumPy (обчислення виразів над стовпцями)
+        if (b == 0).any() if getattr(b, 'ndim', 0) else b == 0:
+            raise ValueError("Ділення на нуль")
+        return a / b
+    
+    def execute_int(self, a: int, b: int) -> int:
+        if b == 0:
+            raise ValueError("Ділення на нуль")
+        # Відкидання дробової частини (як int(a / b)), але точне для великих чисел
+        quotient = abs(a) // abs(b)
+        return quotient if (a < 0) == (b < 0) else -quotient
+    
+    def execute_exact(self, a: Decimal, b: Decimal, context: Context) -> Decimal:
+        if not b:
+            raise ValueError("Ділення на нуль")
+        return context.divide(a, b)
+
+
+# ==================== ФАБРИКА ====================
+class OperationFactory:
+    """Фабрика для створення операцій (патерн Фабрика)"""
+    
+    _operations = {
+        OperationType.ADD: AddOperation(),
+        OperationType.SUBTRACT: SubtractOperation(),
+        OperationType.MULTIPLY: MultiplyOperation(),
+        OperationType.DIVIDE: DivideOperation(),
+    }
+    
+    @classmethod
+    def get_operation(cls, op_type: OperationType) -> Optional[Operation]:
+        return cls._operations.get(op_type)
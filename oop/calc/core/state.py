@@ -0,0 +1,78 @@
+"""
+Стан калькулятора
+"""
+
+from typing import Optional
+
+from .number_systems import NumberSystem, NumberSystemRegistry
+from .operations import Number, OperationType
+
+
+# ==================== ІНКАПСУЛЯЦІЯ ====================
+class CalculatorState:
+    """Клас для збереження стану калькулятора (інкапсуляція даних)"""
+    
+    def __init__(self):
+        self.__current_value: str = "0"
+        self.__stored_value: Optional[Number] = None
+        self.__operation: OperationType = OperationType.NONE
+        self.__is_new_number: bool = True
+        self.__number_system: NumberSystem = NumberSystemRegistry.get('DEC')
+        self.__exact: bool = False
+    
+    # Геттери та сеттери (інкапсуляція)
+    @property
+    def current_value(self) -> str:
+        return self.__current_value
+    
+    @current_value.setter
+    def current_value(self, value: str):
+        self.__current_value = value
+    
+    @property
+    def stored_value(self) -> Optional[Number]:
+        return self.__stored_value
+    
+    @stored_value.setter
+    def stored_value(self, value: Optional[Number]):
+        self.__stored_value = value
+    
+    @property
+    def operation(self) -> OperationType:
+        return self.__operation
+    
+    @operation.setter
+    def operation(self, op: OperationType):
+        self.__operation = op
+    
+    @property
+    def is_new_number(self) -> bool:
+        return self.__is_new_number
+    
+    @is_new_number.setter
+    def is_new_number(self, value: bool):
+        self.__is_new_number = value
+    
+    @property
+    def number_system(self) -> NumberSystem:
+        return self.__number_system
+    
+    @number_system.setter
+    def number_system(self, system: NumberSystem):
+        self.__number_system = system
+    
+    @property
+    def exact(self) -> bool:
+        """Точний режим (Decimal замість float для десяткової системи)"""
+        return self.__exact
+    
+    @exact.setter
+    def exact(self, value: bool):
+        self.__exact = value
+    
+    def reset(self):
+        """Скидання стану"""
+        self.__current_value = "0"
+        self.__stored_value = None
+        self.__operation = OperationType.NONE
+        self.__is_new_number = True
@@ -0,0 +1,243 @@
+"""
+Стрічка обчислень: append-only файл записів фіксованої ширини з відображенням у пам'ять
+Доступ до n-го запису за O(1); пошук за діапазоном значень через зональний індекс блоків
+"""
+
+import math
+import mmap
+import os
+import struct
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+from typing import Iterator
+
+from .operations import Number, OperationType
+
+TapeEntry = namedtuple('TapeEntry', 'operation a b result')
+
+_OPERATIONS = list(OperationType)
+_OPERATION_CODES = {op: code for code, op in enumerate(_OPERATIONS)}
+
+# Тип 8-байтової комірки: float64, int64 або зсув цілого, ширшого за int64, у файлі .wide
+_FLOAT, _INT, _WIDE = 0, 1, 2
+_SLOT_FORMATS = {_FLOAT: 'd', _INT: 'q', _WIDE: 'q'}
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+@lru_cache(maxsize=None)
+def _record_struct(kinds: int) -> struct.Struct:
+    """Розмітка запису для комбінації типів комірок a, b, результату (по 2 біти)"""
+    slots = ''.join(_SLOT_FORMATS[(kinds >> shift) & 3] for shift in (0, 2, 4))
+    return struct.Struct('<' + slots + 'dBB6x')
+
+
+def _search_key(value: Number) -> float:
+    """Найближчий float для зонального індексу; цілі поза діапазоном double - нескінченність"""
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+
+
+class CalculationTape:
+    """Append-only стрічка: заголовок + записи (a, b, результат, ключ, код операції) по 40 байтів
+
+    Дані живуть у файлі, відображеному в пам'ять, тож сторінки з давніми записами
+    ОС може витісняти - RSS не росте разом із довжиною стрічки. Цілі (BIN/HEX)
+    зберігаються точно: до int64 - у самому записі, ширші - у сусідньому файлі .wide.
+    Для пошуку за значенням зберігаються лише min/max ключа результату (float)
+    для кожного блоку з BLOCK записів.
+    """
+
+    MAGIC = b'CALCTAP2'
+    HEADER = struct.Struct('<8sQ')
+    RECORD = _record_struct(0)
+    KEY = struct.Struct('<24xd8x')
+    KINDS_OFFSET = 33
+    WIDE_LENGTH = struct.Struct('<I')
+    BLOCK = 4096
+    INITIAL_CAPACITY = 65536
+
+    def __init__(self, path: str):
+        self.path = path
+        self._wide = None
+        # порожній файл вважається новою стрічкою, будь-який інший мусить мати заголовок
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'r+b' if exists else 'w+b')
+        self._block_min = array('d')
+        self._block_max = array('d')
+
+        if exists:
+            header = self._file.read(self.HEADER.size)
+            if len(header) < self.HEADER.size or header[:len(self.MAGIC)] != self.MAGIC:
+                self._file.close()
+                raise ValueError(f"Файл {path} не є стрічкою калькулятора")
+            _, self._count = self.HEADER.unpack(header)
+            size = os.path.getsize(path)
+            self._capacity = (size - self.HEADER.size) // self.RECORD.size
+        else:
+            self._count = 0
+            self._capacity = self.INITIAL_CAPACITY
+            self._file.truncate(self._file_size(self._capacity))
+
+        self._map()
+        if exists:
+            self._rebuild_index()
+        else:
+            self._write_header()
+
+    # ---------- Розмітка файлу ----------
+    def _file_size(self, capacity: int) -> int:
+        return self.HEADER.size + capacity * self.RECORD.size
+
+    def _map(self):
+        self._mm = mmap.mmap(self._file.fileno(), self._file_size(self._capacity))
+
+    def _grow(self):
+        """Подвоєння місткості: амортизовано O(1) на запис"""
+        self._mm.close()
+        self._capacity *= 2
+        self._file.truncate(self._file_size(self._capacity))
+        self._map()
+
+    def _write_header(self):
+        self.HEADER.pack_into(self._mm, 0, self.MAGIC, self._count)
+
+    def _offset(self, index: int) -> int:
+        return self.HEADER.size + index * self.RECORD.size
+
+    def _release(self, start: int, stop: int):
+        """Віддає ОС сторінки заповненого блоку (дані лишаються у файлі та кеші сторінок)"""
+        if not hasattr(self._mm, 'madvise') or not hasattr(mmap, 'MADV_DONTNEED'):
+            return
+        page = mmap.PAGESIZE
+        begin = -(-self._offset(start) // page) * page
+        end = self._offset(stop) // page * page
+        if end > begin:
+            self._mm.madvise(mmap.MADV_DONTNEED, begin, end - begin)
+
+    def _rebuild_index(self):
+        """Зональний індекс для наявного файлу: один потоковий прохід"""
+        for start in range(0, self._count, self.BLOCK):
+            stop = min(start + self.BLOCK, self._count)
+            view = memoryview(self._mm)[self._offset(start):self._offset(stop)]
+            results = [record[0] for record in self.KEY.iter_unpack(view)]
+            view.release()
+            self._block_min.append(min(results))
+            self._block_max.append(max(results))
+            self._release(start, stop)
+
+    # ---------- Цілі, ширші за int64 ----------
+    def _wide_file(self):
+        if self._wide is None:
+            self._wide = open(self.path + '.wide', 'a+b')
+        return self._wide
+
+    def _store_wide(self, value: int) -> int:
+        """Дописує ціле у файл .wide і повертає його зсув"""
+        data = value.to_bytes(value.bit_length() // 8 + 1, 'little', signed=True)
+        wide = self._wide_file()
+        offset = wide.seek(0, os.SEEK_END)
+        wide.write(self.WIDE_LENGTH.pack(len(data)) + data)
+        wide.flush()
+        return offset
+
+    def _load_wide(self, offset: int) -> int:
+        wide = self._wide_file()
+        wide.seek(offset)
+        length, = self.WIDE_LENGTH.unpack(wide.read(self.WIDE_LENGTH.size))
+        return int.from_bytes(wide.read(length), 'little', signed=True)
+
+    def _encode(self, value: Number):
+        """Значення -> (тип комірки, вміст комірки)"""
+        if type(value) is int:
+            if _INT64_MIN <= value <= _INT64_MAX:
+                return _INT, value
+            return _WIDE, self._store_wide(value)
+        return _FLOAT, float(value)
+
+    def _decode(self, kind: int, slot) -> Number:
+        return self._load_wide(slot) if kind == _WIDE else slot
+
+    # ---------- Запис ----------
+    def append(self, operation: OperationType, a: Number, b: Number, result: Number) -> int:
+        """Додає запис і повертає його номер"""
+        if self._count == self._capacity:
+            self._grow()
+        index = self._count
+        kind_a, a = self._encode(a)
+        kind_b, b = self._encode(b)
+        kind_result, slot = self._encode(result)
+        kinds = kind_a | kind_b << 2 | kind_result << 4
+        result = _search_key(result)
+        _record_struct(kinds).pack_into(self._mm, self._offset(index), a, b, slot, result,
+                                        _OPERATION_CODES[operation], kinds)
+
+        block = index // self.BLOCK
+        if block == len(self._block_min):
+            self._block_min.append(result)
+            self._block_max.append(result)
+        else:
+            if result < self._block_min[block]:
+                self._block_min[block] = result
+            if result > self._block_max[block]:
+                self._block_max[block] = result
+
+        self._count += 1
+        self._write_header()
+        if self._count % self.BLOCK == 0:
+            self._release(self._count - self.BLOCK, self._count)
+        return index
+
+    # ---------- Читання ----------
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> TapeEntry:
+        """n-й запис за O(1); від'ємні індекси - з кінця"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Номер запису поза стрічкою")
+        offset = self._offset(index)
+        kinds = self._mm[offset + self.KINDS_OFFSET]
+        a, b, result, _, code, _ = _record_struct(kinds).unpack_from(self._mm, offset)
+        return TapeEntry(_OPERATIONS[code], self._decode(kinds & 3, a),
+                         self._decode(kinds >> 2 & 3, b), self._decode(kinds >> 4 & 3, result))
+
+    def find_range(self, low: Number, high: Number) -> Iterator[int]:
+        """Номери записів з результатом у [low, high]; блоки поза діапазоном пропускаються
+
+        Ключі індексу - найближчі float, тож межі розширюються на один крок,
+        а кандидати-цілі перевіряються за точним значенням.
+        """
+        key_low = math.nextafter(_search_key(low), -math.inf)
+        key_high = math.nextafter(_search_key(high), math.inf)
+        unpack_key = self.KEY.unpack_from
+        for block in range(len(self._block_min)):
+            if self._block_max[block] < key_low or self._block_min[block] > key_high:
+                continue
+            start = block * self.BLOCK
+            for index in range(start, min(start + self.BLOCK, self._count)):
+                key = unpack_key(self._mm, self._offset(index))[0]
+                if key_low <= key <= key_high and low <= self[index].result <= high:
+                    yield index
+
+    # ---------- Життєвий цикл ----------
+    def flush(self):
+        self._mm.flush()
+
+    def close(self):
+        if not self._mm.closed:
+            self._mm.flush()
+            self._mm.close()
+            self._file.close()
+            if self._wide is not None:
+                self._wide.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
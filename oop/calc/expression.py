@@ -0,0 +1,175 @@
+"""
+Компілятор інфіксних виразів поверх стратегій Operation
+Вираз розбирається один раз (пріоритети, дужки, унарний мінус), скомпільовані форми кешуються (LRU)
+"""
+
+import re
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, List, Tuple
+
+from core import OperationFactory, OperationType
+
+
+# Символ оператора -> (тип операції, пріоритет)
+BINARY_OPERATORS = {
+    '+': (OperationType.ADD, 1),
+    '-': (OperationType.SUBTRACT, 1),
+    '×': (OperationType.MULTIPLY, 2),
+    '*': (OperationType.MULTIPLY, 2),
+    '/': (OperationType.DIVIDE, 2),
+}
+UNARY_PRECEDENCE = 3
+CACHE_SIZE = 256
+
+_TOKEN_RE = re.compile(r'\s*(?:(\d+\.?\d*|\.\d+)|([A-Za-z_]\w*)|(\S))')
+
+Node = Callable[[Dict[str, object]], object]
+
+
+def tokenize(source: str) -> List[Tuple[str, str]]:
+    """Рядок -> список токенів (вид, текст): 'num', 'var', 'op', '(' або ')'"""
+    tokens = []
+    position = 0
+    source = source.rstrip()
+    while position < len(source):
+        match = _TOKEN_RE.match(source, position)
+        number, name, symbol = match.groups()
+        if number is not None:
+            tokens.append(('num', number))
+        elif name is not None:
+            tokens.append(('var', name))
+        elif symbol in BINARY_OPERATORS:
+            tokens.append(('op', symbol))
+        elif symbol in '()':
+            tokens.append((symbol, symbol))
+        else:
+            raise ValueError(f"Неочікуваний символ '{symbol}' у позиції {match.start(3)}")
+        position = match.end()
+    return tokens
+
+
+def to_rpn(tokens: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Алгоритм сортувальної станції: інфіксні токени -> зворотний польський запис"""
+    output = []
+    stack = []
+    expect_operand = True
+    for kind, text in tokens:
+        if kind in ('num', 'var'):
+            if not expect_operand:
+                raise ValueError(f"Пропущено оператор перед '{text}'")
+            output.append((kind, text))
+            expect_operand = False
+        elif kind == '(':
+            if not expect_operand:
+                raise ValueError("Пропущено оператор перед '('")
+            stack.append((kind, text))
+        elif kind == ')':
+            if expect_operand:
+                raise ValueError("Порожні дужки або оператор перед ')'")
+            while stack and stack[-1][0] != '(':
+                output.append(stack.pop())
+            if not stack:
+                raise ValueError("Незбалансовані дужки")
+            stack.pop()
+        elif expect_operand:
+            if text not in '+-':
+                raise ValueError(f"Оператор '{text}' без лівого операнда")
+            # Унарні оператори правоасоціативні: нічого не виштовхуємо
+            stack.append(('neg' if text == '-' else 'pos', text))
+        else:
+            precedence = BINARY_OPERATORS[text][1]
+            while stack and stack[-1][0] != '(' and _precedence(stack[-1]) >= precedence:
+                output.append(stack.pop())
+            stack.append((kind, text))
+            expect_operand = True
+    if expect_operand:
+        raise ValueError("Вираз не може закінчуватися оператором")
+    while stack:
+        if stack[-1][0] == '(':
+            raise ValueError("Незбалансовані дужки")
+        output.append(stack.pop())
+    return output
+
+
+def _precedence(token: Tuple[str, str]) -> int:
+    kind, text = token
+    return UNARY_PRECEDENCE if kind in ('neg', 'pos') else BINARY_OPERATORS[text][1]
+
+
+class CompiledExpression:
+    """Скомпільований вираз: дерево замикань, готове до повторних обчислень
+
+    Значення змінних можуть бути числами або масивами NumPy однакової форми -
+    тоді одна формула обчислюється для цілого стовпця.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        names = []
+        self._root = self._build(to_rpn(tokenize(source)), names)
+        self.variables: Tuple[str, ...] = tuple(names)
+
+    def _build(self, rpn: List[Tuple[str, str]], names: List[str]) -> Node:
+        stack: List[Tuple[Node, bool]] = []
+        for kind, text in rpn:
+            if kind == 'num':
+                stack.append((_constant(float(text)), True))
+            elif kind == 'var':
+                if text not in names:
+                    names.append(text)
+                stack.append((itemgetter(text), False))
+            elif kind in ('neg', 'pos'):
+                node, constant = stack.pop()
+                if kind == 'neg':
+                    node = _negate(node)
+                stack.append(_fold(node, constant))
+            else:
+                right, right_constant = stack.pop()
+                left, left_constant = stack.pop()
+                execute = OperationFactory.get_operation(BINARY_OPERATORS[text][0]).execute
+                stack.append(_fold(_binary(execute, left, right), left_constant and right_constant))
+        root, _ = stack.pop()
+        return root
+
+    def evaluate(self, **values):
+        """Обчислення для заданих значень змінних"""
+        missing = [name for name in self.variables if name not in values]
+        if missing:
+            raise ValueError(f"Не задано значення змінних: {', '.join(missing)}")
+        return self._root(values)
+
+    __call__ = evaluate
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.source!r})"
+
+
+def _constant(value) -> Node:
+    return lambda env: value
+
+
+def _negate(node: Node) -> Node:
+    return lambda env: -node(env)
+
+
+def _binary(execute, left: Node, right: Node) -> Node:
+    return lambda env: execute(left(env), right(env))
+
+
+def _fold(node: Node, constant: bool) -> Tuple[Node, bool]:
+    """Згортання підвиразів без змінних ще на етапі компіляції"""
+    if constant:
+        return _constant(node({})), True
+    return node, False
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(source: str) -> CompiledExpression:
+    """Компіляція з обмеженим LRU-кешем; повторні рядки не розбираються вдруге"""
+    return CompiledExpression(source)
+
+
+def evaluate(source: str, **values):
+    """Обчислення виразу через кеш скомпільованих форм"""
+    return compile_expression(source).evaluate(**values)
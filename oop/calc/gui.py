@@ -0,0 +1,227 @@
+"""
+GUI калькулятора на tkinter
+Завантажується лише під час запуску вікна, ядро (core) від нього не залежить
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Optional
+
+from core import CalculationTape, CalculatorEngine, CalculatorState, NumberSystemRegistry
+
+
+# ==================== GUI КОМПОНЕНТИ (Композиція) ====================
+class DisplayWidget:
+    """Віджет дисплею"""
+    
+    def __init__(self, parent):
+        self.display = tk.Entry(
+            parent,
+            font=('Arial', 24, 'bold'),
+            justify='right',
+            bd=10,
+            relief='sunken',
+            state='readonly'
+        )
+        self.display.grid(row=0, column=0, columnspan=4, padx=10, pady=10, sticky='nsew')
+        self._value = None
+    
+    def update(self, value: str):
+        """Оновлення дисплею"""
+        if value == self._value:
+            return
+        self._value = value
+        self.display.config(state='normal')
+        self.display.delete(0, tk.END)
+        self.display.insert(0, value)
+        self.display.config(state='readonly')
+
+
+class ButtonGrid:
+    """Сітка кнопок"""
+    
+    def __init__(self, parent, button_callback):
+        self.parent = parent
+        self.callback = button_callback
+        self._create_buttons()
+    
+    def _create_buttons(self):
+        """Створення кнопок"""
+        # Кнопки цифр та операцій
+        buttons = [
+            ('C', 1, 0, 'red'), ('←', 1, 1, 'orange'), ('1/X', 1, 2, 'blue'), ('/', 1, 3, 'green'),
+            ('7', 2, 0, 'gray'), ('8', 2, 1, 'gray'), ('9', 2, 2, 'gray'), ('×', 2, 3, 'green'),
+            ('4', 3, 0, 'gray'), ('5', 3, 1, 'gray'), ('6', 3, 2, 'gray'), ('-', 3, 3, 'green'),
+            ('1', 4, 0, 'gray'), ('2', 4, 1, 'gray'), ('3', 4, 2, 'gray'), ('+', 4, 3, 'green'),
+            ('±', 5, 0, 'blue'), ('0', 5, 1, 'gray'), ('.', 5, 2, 'gray'), ('=', 5, 3, 'darkgreen'),
+        ]
+        
+        for (text, row, col, color) in buttons:
+            btn = tk.Button(
+                self.parent,
+                text=text,
+                font=('Arial', 18, 'bold'),
+                bg=color,
+                fg='white',
+                command=lambda t=text: self.callback(t),
+                height=2,
+                width=5
+            )
+            btn.grid(row=row, column=col, padx=5, pady=5, sticky='nsew')
+
+
+class ModeSelector:
+    """Вибір режиму системи числення"""
+    
+    def __init__(self, parent, mode_callback, exact_callback):
+        self.frame = ttk.LabelFrame(parent, text="Система числення", padding=10)
+        self.frame.grid(row=6, column=0, columnspan=4, padx=10, pady=10, sticky='ew')
+        
+        self.mode_var = tk.StringVar(value="DEC")
+        
+        for idx, (text, value) in enumerate(NumberSystemRegistry.modes()):
+            rb = ttk.Radiobutton(
+                self.frame,
+                text=text,
+                value=value,
+                variable=self.mode_var,
+                command=lambda v=value: mode_callback(v)
+            )
+            rb.grid(row=idx // 3, column=idx % 3, padx=10, sticky='w')
+        
+        self.exact_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            self.frame,
+            text="Точний режим (Decimal)",
+            variable=self.exact_var,
+            command=lambda: exact_callback(self.exact_var.get())
+        ).grid(row=idx // 3 + 1, column=0, columnspan=3, padx=10, pady=(5, 0), sticky='w')
+
+
+# ==================== ГОЛОВНИЙ КЛАС (Фасад) ====================
+class Calculator:
+    """Головний клас калькулятора (патерн Фасад)"""
+    
+    # Не частіше одного перемальовування дисплею за кадр (~60 Гц)
+    FRAME_MS = 16
+    
+    # Клавіші, що відповідають кнопкам
+    KEY_BUTTONS = {
+        'Return': '=',
+        'KP_Enter': '=',
+        'BackSpace': '←',
+        'Escape': 'C',
+        'Delete': 'C',
+    }
+    
+    def __init__(self, root, tape_path: Optional[str] = None):
+        self.root = root
+        self.root.title("Модульний ООП Калькулятор")
+        self.root.resizable(False, False)
+        
+        # Ініціалізація компонентів
+        self._state = CalculatorState()
+        self._tape = CalculationTape(tape_path) if tape_path else None
+        self._engine = CalculatorEngine(self._state, self._tape)
+        
+        # Лічильники для злиття перемальовувань
+        self._refresh_pending = False
+        self._events_since_repaint = 0
+        self._events_total = 0
+        self._repaints_total = 0
+        
+        # Створення GUI
+        self._setup_gui()
+        self._configure_grid()
+        self._bind_keys()
+        
+        # Оновлення дисплею
+        self._update_display()
+    
+    def _setup_gui(self):
+        """Налаштування GUI"""
+        main_frame = ttk.Frame(self.root, padding=10)
+        main_frame.grid(row=0, column=0, sticky='nsew')
+        
+        self._display = DisplayWidget(main_frame)
+        self._button_grid = ButtonGrid(main_frame, self._on_button_click)
+        self._mode_selector = ModeSelector(main_frame, self._on_mode_change, self._on_exact_change)
+        
+        self._stats_label = ttk.Label(main_frame, anchor='e', foreground='gray')
+        self._stats_label.grid(row=7, column=0, columnspan=4, padx=10, sticky='ew')
+    
+    def _bind_keys(self):
+        """Клавіатура та вставка з буфера обміну"""
+        self.root.bind('<Key>', self._on_key)
+        self.root.bind('<<Paste>>', self._on_paste)
+        self.root.bind('<Control-v>', self._on_paste)
+    
+    def _configure_grid(self):
+        """Налаштування сітки"""
+        for i in range(6):
+            self.root.grid_rowconfigure(i, weight=1)
+        for i in range(4):
+            self.root.grid_columnconfigure(i, weight=1)
+    
+    def _on_button_click(self, button_text: str):
+        """Обробка натискання кнопки"""
+        self._engine.press(button_text)
+        self._schedule_refresh()
+    
+    def _on_key(self, event):
+        """Обробка натискання клавіші"""
+        if event.keysym in self.KEY_BUTTONS:
+            self._engine.press(self.KEY_BUTTONS[event.keysym])
+        elif event.char and not event.state & 0x4:  # Ctrl-комбінації не є введенням
+            self._engine.input_text(event.char)
+        else:
+            return
+        self._schedule_refresh()
+    
+    def _on_paste(self, event=None):
+        """Вставка тексту з буфера обміну одним пакетом"""
+        try:
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            return 'break'
+        self._engine.input_text(text)
+        self._schedule_refresh()
+        return 'break'
+    
+    def _on_mode_change(self, mode: str):
+        """Обробка зміни режиму"""
+        self._engine.change_number_system(NumberSystemRegistry.get(mode))
+        self._schedule_refresh()
+    
+    def _on_exact_change(self, enabled: bool):
+        """Перемикання точного режиму"""
+        self._engine.set_exact_mode(enabled)
+    
+    def _schedule_refresh(self):
+        """Відкладене оновлення: усі події за кадр дають одне перемальовування"""
+        self._events_since_repaint += 1
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after(self.FRAME_MS, self._update_display)
+    
+    def _update_display(self):
+        """Оновлення дисплею"""
+        self._refresh_pending = False
+        self._display.update(self._state.current_value)
+        
+        if self._events_since_repaint:
+            self._events_total += self._events_since_repaint
+            self._repaints_total += 1
+            self._stats_label.config(
+                text=f"Подій за кадр: {self._events_since_repaint} | "
+                     f"у середньому: {self._events_total / self._repaints_total:.1f}"
+            )
+            self._events_since_repaint = 0
+    
+    def run(self):
+        """Запуск калькулятора"""
+        try:
+            self.root.mainloop()
+        finally:
+            if self._tape is not None:
+                self._tape.close()
@@ -0,0 +1,169 @@
+"""
+Asyncio-сервер калькулятора з протоколом JSON-рядків
+Тисячі сесій на одному сокеті (TCP або Unix); неактивні сесії витісняються
+
+Запит:   {"session": "id", "keys": ["1", "+", "2", "="]}   (необов'язково "mode": "HEX")
+         {"session": "id", "close": true}
+Відповідь: {"session": "id", "display": "3"} або {"error": "..."}
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from batch import apply_tokens
+from core import CalculatorEngine, CalculatorState, NumberSystemRegistry
+
+
+class Session:
+    """Легка сесія: власний стан і двигун"""
+
+    __slots__ = ('state', 'engine', 'last_used')
+
+    def __init__(self):
+        self.state = CalculatorState()
+        self.engine = CalculatorEngine(self.state)
+        self.last_used = time.monotonic()
+
+
+class SessionPool:
+    """Сесії в порядку останнього використання (LRU) з витісненням за простоєм"""
+
+    def __init__(self, idle_timeout: float = 300.0, max_sessions: int = 100_000):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> Session:
+        session = self._sessions.get(session_id)
+        if session is None:
+            if len(self._sessions) >= self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted += 1
+            session = self._sessions[session_id] = Session()
+        else:
+            self._sessions.move_to_end(session_id)
+        session.last_used = time.monotonic()
+        return session
+
+    def close(self, session_id: str):
+        self._sessions.pop(session_id, None)
+
+    def evict_idle(self) -> int:
+        """Видаляє сесії, що простоюють довше idle_timeout; найстаріші - на початку"""
+        deadline = time.monotonic() - self.idle_timeout
+        count = 0
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_used > deadline:
+                break
+            del self._sessions[session_id]
+            count += 1
+        self.evicted += count
+        return count
+
+
+class CalculatorServer:
+    """Мультиплексування сесій калькулятора поверх asyncio"""
+
+    def __init__(self, pool: Optional[SessionPool] = None):
+        self.pool = pool if pool is not None else SessionPool()
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._reaper: Optional[asyncio.Task] = None
+
+    def handle_request(self, request: dict) -> dict:
+        """Обробка одного запиту (синхронно: двигун не блокує)"""
+        session_id = request.get('session')
+        if not isinstance(session_id, str):
+            return {'error': "Поле 'session' обов'язкове"}
+        if request.get('close'):
+            self.pool.close(session_id)
+            return {'session': session_id, 'closed': True}
+
+        mode = request.get('mode')
+        if mode is not None and not NumberSystemRegistry.has(mode):
+            return {'session': session_id, 'error': f"Невідомий режим: {mode}"}
+
+        session = self.pool.get(session_id)
+        try:
+            if mode is not None:
+                session.engine.change_number_system(NumberSystemRegistry.get(mode))
+            apply_tokens(session.engine, request.get('keys', ()))
+        except ArithmeticError as e:
+            # помилка двигуна стосується лише цієї сесії, з'єднання та інші сесії живуть далі
+            return {'session': session_id, 'error': f"Помилка обчислення: {e}"}
+        return {'session': session_id, 'display': session.state.current_value}
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = self.handle_request(json.loads(line))
+                except (ValueError, AttributeError, TypeError) as e:
+                    response = {'error': f"Некоректний запит: {e}"}
+                self.requests += 1
+                writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _reap_idle(self):
+        interval = max(self.pool.idle_timeout / 2, 0.1)
+        while True:
+            await asyncio.sleep(interval)
+            self.pool.evict_idle()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765, unix_path: Optional[str] = None):
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._handle_client, path=unix_path)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host, port)
+        self._reaper = asyncio.create_task(self._reap_idle())
+        return self._server
+
+    async def stop(self):
+        if self._reaper:
+            self._reaper.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def serve_forever(self, **kwargs):
+        server = await self.start(**kwargs)
+        try:
+            await server.serve_forever()
+        finally:
+            await self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сервер калькулятора (JSON-рядки)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="шлях до Unix-сокета замість TCP")
+    parser.add_argument('--idle-timeout', type=float, default=300.0, help="секунд до витіснення сесії")
+    parser.add_argument('--max-sessions', type=int, default=100_000)
+    args = parser.parse_args()
+
+    server = CalculatorServer(SessionPool(args.idle_timeout, args.max_sessions))
+    try:
+        asyncio.run(server.serve_forever(host=args.host, port=args.port, unix_path=args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
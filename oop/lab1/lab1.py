@@ -1,6 +1,232 @@
 import tkinter as tk
 from tkinter import ttk
 import tkinter.messagebox as messagebox
+import time
+
+
+def center_window(window, width, height):
+    screen_width = window.winfo_screenwidth()
+    screen_height = window.winfo_screenheight()
+    x = (screen_width - width) // 2
+    y = (screen_height - height) // 2
+    window.geometry(f"{width}x{height}+{x}+{y}")
+
+
+class ScreenManager:
+    def __init__(self, root, on_navigate=None):
+        self.root = root
+        self.on_navigate = on_navigate
+        self.builders = {}
+        self.screens = {}
+        self.current = None
+        self.navigation_times = {}
+        
+        self.container = tk.Frame(root)
+        self.container.pack(fill=tk.BOTH, expand=True)
+        self.container.grid_rowconfigure(0, weight=1)
+        self.container.grid_columnconfigure(0, weight=1)
+    
+    def register(self, name, builder):
+        self.builders[name] = builder
+    
+    def show(self, name):
+        started = time.perf_counter()
+        
+        frame = self.screens.get(name)
+        if frame is None:
+            frame = tk.Frame(self.container)
+            frame.grid(row=0, column=0, sticky="nsew")
+            self.builders[name](frame)
+            self.screens[name] = frame
+        frame.tkraise()
+        self.current = name
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.navigation_times.setdefault(name, []).append(elapsed_ms)
+        if self.on_navigate:
+            self.on_navigate(name, elapsed_ms)
+        return frame
+
+
+class ScaleDialog:
+    def __init__(self, root, title, from_, to, on_ok, width=350, height=180):
+        self.root = root
+        self.on_ok = on_ok
+        self.width = width
+        self.height = height
+        self.open_count = 0
+        
+        self.dialog = tk.Toplevel(root)
+        self.dialog.withdraw()
+        self.dialog.title(title)
+        self.dialog.geometry(f"{width}x{height}")
+        self.dialog.resizable(False, False)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
+        
+        label = tk.Label(self.dialog, text=f"Виберіть число від {from_} до {to}:")
+        label.pack(pady=10)
+        
+        self.scale_var = tk.IntVar(value=from_)
+        self.scale = tk.Scale(self.dialog, from_=from_, to=to, orient=tk.HORIZONTAL, 
+                              variable=self.scale_var, length=200, command=self.on_scale)
+        self.scale.pack(pady=5)
+        
+        self.current_label = tk.Label(self.dialog, text="")
+        self.current_label.pack(pady=5)
+        
+        button_frame = tk.Frame(self.dialog)
+        button_frame.pack(pady=10)
+        
+        ok_btn = tk.Button(button_frame, text="Так", width=15, height=2, 
+                          font=("Arial", 10), command=self.accept)
+        ok_btn.pack(side=tk.LEFT, padx=10)
+        
+        cancel_btn = tk.Button(button_frame, text="Відміна", width=15, height=2,
+                              font=("Arial", 10), command=self.close)
+        cancel_btn.pack(side=tk.LEFT, padx=10)
+    
+    def on_scale(self, value):
+        self.current_label.config(text=f"Поточне значення: {value}")
+    
+    def open(self, value):
+        self.scale_var.set(value)
+        self.on_scale(value)
+        self.open_count += 1
+        
+        center_window(self.dialog, self.width, self.height)
+        self.dialog.deiconify()
+        self.dialog.lift()
+        self.dialog.grab_set()
+    
+    def accept(self):
+        value = self.scale_var.get()
+        self.close()
+        self.on_ok(value)
+    
+    def close(self):
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+
+
+class WizardStep:
+    def __init__(self, title, text, width, height, cancel_message):
+        self.title = title
+        self.text = text
+        self.width = width
+        self.height = height
+        self.cancel_message = cancel_message
+
+
+class Wizard:
+    def __init__(self, root, steps, on_finish, on_cancel):
+        self.root = root
+        self.steps = steps
+        self.on_finish = on_finish
+        self.on_cancel = on_cancel
+        self.windows = {}
+        self.history = []
+        self.current = None
+        self.open_times = {}
+    
+    def is_active(self):
+        return self.current is not None
+    
+    def start(self):
+        if self.is_active():
+            self.windows[self.current].lift()
+            return
+        self.history = []
+        self.go(0)
+    
+    def build(self, index):
+        window = self.windows.get(index)
+        if window is not None:
+            return window
+        
+        step = self.steps[index]
+        window = tk.Toplevel(self.root)
+        window.withdraw()
+        window.title(step.title)
+        window.geometry(f"{step.width}x{step.height}")
+        window.resizable(False, False)
+        window.protocol("WM_DELETE_WINDOW", self.cancel)
+        
+        label = tk.Label(window, text=step.text)
+        label.pack(pady=10)
+        
+        button_frame = tk.Frame(window)
+        button_frame.pack(pady=10)
+        
+        width = 12 if index > 0 else 15
+        padx = 5 if index > 0 else 10
+        if index > 0:
+            back_btn = tk.Button(button_frame, text="< Назад", width=width, height=2,
+                                font=("Arial", 10), command=self.back)
+            back_btn.pack(side=tk.LEFT, padx=padx)
+        
+        if index < len(self.steps) - 1:
+            next_btn = tk.Button(button_frame, text="Далі >", width=width, height=2,
+                                font=("Arial", 10), command=self.next)
+        else:
+            next_btn = tk.Button(button_frame, text="Так", width=width, height=2,
+                                font=("Arial", 10), command=self.finish)
+        next_btn.pack(side=tk.LEFT, padx=padx)
+        
+        cancel_btn = tk.Button(button_frame, text="Відміна", width=width, height=2,
+                              font=("Arial", 10), command=self.cancel)
+        cancel_btn.pack(side=tk.LEFT, padx=padx)
+        
+        self.windows[index] = window
+        return window
+    
+    def prebuild(self, index):
+        if index < len(self.steps) and self.is_active():
+            self.build(index)
+    
+    def go(self, index):
+        started = time.perf_counter()
+        
+        self.hide_current()
+        step = self.steps[index]
+        window = self.build(index)
+        center_window(window, step.width, step.height)
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+        self.current = index
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.open_times.setdefault(index, []).append(elapsed_ms)
+        self.root.after_idle(self.prebuild, index + 1)
+    
+    def next(self):
+        self.history.append(self.current)
+        self.go(self.current + 1)
+    
+    def back(self):
+        if self.history:
+            self.go(self.history.pop())
+    
+    def hide_current(self):
+        if self.current is not None:
+            window = self.windows[self.current]
+            window.grab_release()
+            window.withdraw()
+    
+    def close(self):
+        self.hide_current()
+        self.current = None
+        self.history = []
+    
+    def finish(self):
+        self.close()
+        self.on_finish()
+    
+    def cancel(self):
+        step = self.steps[self.current]
+        self.close()
+        self.on_cancel(step.cancel_message)
+
 
 class Lab1App:
     def __init__(self):
@@ -11,201 +237,110 @@ class Lab1App:
         
         self.center_window(self.root, 400, 300)
         
-        self.create_main_menu()
-        
         self.selected_number = 50
         
-        self.dialog1 = None
-        self.dialog2 = None
+        self.nav_label = tk.Label(self.root, text="", font=("Arial", 8), fg="gray", anchor="e")
+        self.nav_label.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        self.screens = ScreenManager(self.root, on_navigate=self.on_navigate)
+        self.screens.register("menu", self.build_main_menu)
+        self.screens.register("variant1", self.build_variant1)
+        self.screens.register("variant2", self.build_variant2)
+        self.create_main_menu()
+        
+        self.scale_dialog = None
+        self.wizard = Wizard(self.root, [
+            WizardStep("Перший діалог", "Це перший діалог", 280, 130,
+                       cancel_message="Перший діалог скасовано"),
+            WizardStep("Другий діалог", "Це другий діалог", 380, 130,
+                       cancel_message="Другий діалог скасовано"),
+        ], on_finish=self.on_wizard_finish, on_cancel=self.set_status)
     
     def center_window(self, window, width, height):
-        screen_width = window.winfo_screenwidth()
-        screen_height = window.winfo_screenheight()
-        x = (screen_width - width) // 2
-        y = (screen_height - height) // 2
-        window.geometry(f"{width}x{height}+{x}+{y}")
+        center_window(window, width, height)
+    
+    def on_navigate(self, name, elapsed_ms):
+        self.nav_label.config(text=f"Перехід: {elapsed_ms:.2f} мс")
     
     def create_main_menu(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        title_label = tk.Label(self.root, text="Lab1", 
+        self.screens.show("menu")
+    
+    def show_variant1(self):
+        self.screens.show("variant1")
+    
+    def show_variant2(self):
+        self.screens.show("variant2")
+    
+    def build_main_menu(self, frame):
+        title_label = tk.Label(frame, text="Lab1", 
                               font=("Arial", 16, "bold"))
         title_label.pack(pady=20)
         
-        variant1_btn = tk.Button(self.root, text="Варіант 1: Діалог з повзунком", 
+        variant1_btn = tk.Button(frame, text="Варіант 1: Діалог з повзунком", 
                                 width=30, height=2, command=self.show_variant1)
         variant1_btn.pack(pady=10)
         
-        variant2_btn = tk.Button(self.root, text="Варіант 2: Послідовні діалоги", 
+        variant2_btn = tk.Button(frame, text="Варіант 2: Послідовні діалоги", 
                                 width=30, height=2, command=self.show_variant2)
         variant2_btn.pack(pady=10)
         
-        exit_btn = tk.Button(self.root, text="Вихід", width=15, command=self.root.quit)
+        exit_btn = tk.Button(frame, text="Вихід", width=15, command=self.root.quit)
         exit_btn.pack(pady=20)
     
-    def show_variant1(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        title_label = tk.Label(self.root, text="Варіант 1: Діалог з повзунком", 
+    def build_variant1(self, frame):
+        title_label = tk.Label(frame, text="Варіант 1: Діалог з повзунком", 
                               font=("Arial", 14, "bold"))
         title_label.pack(pady=10)
         
-        self.number_display = tk.Label(self.root, text=f"Вибране число: {self.selected_number}", 
+        self.number_display = tk.Label(frame, text=f"Вибране число: {self.selected_number}", 
                                       font=("Arial", 12), bg="lightblue", 
                                       width=30, height=3, relief="sunken")
         self.number_display.pack(pady=20)
         
-        dialog_btn = tk.Button(self.root, text="Відкрити діалог з повзунком", 
+        dialog_btn = tk.Button(frame, text="Відкрити діалог з повзунком", 
                               width=25, height=2, command=self.open_scroll_dialog)
         dialog_btn.pack(pady=10)
         
-        back_btn = tk.Button(self.root, text="Назад до меню", 
+        back_btn = tk.Button(frame, text="Назад до меню", 
                             width=15, command=self.create_main_menu)
         back_btn.pack(pady=10)
     
     def open_scroll_dialog(self):
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Виберіть число")
-        dialog.geometry("350x180")
-        dialog.resizable(False, False)
-        dialog.grab_set()
-        
-        self.center_window(dialog, 350, 180)
-        
-        label = tk.Label(dialog, text="Виберіть число від 1 до 100:")
-        label.pack(pady=10)
-        
-        scale_var = tk.IntVar(value=self.selected_number)
-        scale = tk.Scale(dialog, from_=1, to=100, orient=tk.HORIZONTAL, 
-                        variable=scale_var, length=200)
-        scale.pack(pady=5)
-        
-        current_label = tk.Label(dialog, text=f"Поточне значення: {self.selected_number}")
-        current_label.pack(pady=5)
-        
-        def update_label():
-            current_label.config(text=f"Поточне значення: {scale_var.get()}")
-            dialog.after(100, update_label)
-        
-        update_label()
-        
-        button_frame = tk.Frame(dialog)
-        button_frame.pack(pady=10)
-        
-        def on_ok():
-            self.selected_number = scale_var.get()
-            self.number_display.config(text=f"Вибране число: {self.selected_number}")
-            dialog.destroy()
-        
-        ok_btn = tk.Button(button_frame, text="Так", width=15, height=2, 
-                          font=("Arial", 10), command=on_ok)
-        ok_btn.pack(side=tk.LEFT, padx=10)
-        
-        cancel_btn = tk.Button(button_frame, text="Відміна", width=15, height=2,
-                              font=("Arial", 10), command=dialog.destroy)
-        cancel_btn.pack(side=tk.LEFT, padx=10)
+        if self.scale_dialog is None:
+            self.scale_dialog = ScaleDialog(self.root, "Виберіть число", 1, 100,
+                                            on_ok=self.set_selected_number)
+        self.scale_dialog.open(self.selected_number)
     
-    def show_variant2(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        title_label = tk.Label(self.root, text="Варіант 2: Послідовні діалоги", 
+    def set_selected_number(self, value):
+        self.selected_number = value
+        self.number_display.config(text=f"Вибране число: {self.selected_number}")
+    
+    def build_variant2(self, frame):
+        title_label = tk.Label(frame, text="Варіант 2: Послідовні діалоги", 
                               font=("Arial", 14, "bold"))
         title_label.pack(pady=10)
         
-        self.status_display = tk.Label(self.root, text="Натисніть кнопку нижче для початку", 
+        self.status_display = tk.Label(frame, text="Натисніть кнопку нижче для початку", 
                                       font=("Arial", 12), bg="lightgreen", 
                                       width=40, height=3, relief="sunken")
         self.status_display.pack(pady=20)
         
-        dialog_btn = tk.Button(self.root, text="Відкрити перший діалог", 
+        dialog_btn = tk.Button(frame, text="Відкрити перший діалог", 
                               width=25, height=2, command=self.open_first_dialog)
         dialog_btn.pack(pady=10)
         
-        back_btn = tk.Button(self.root, text="Назад до меню", 
+        back_btn = tk.Button(frame, text="Назад до меню", 
                             width=15, command=self.create_main_menu)
         back_btn.pack(pady=10)
     
     def open_first_dialog(self):
-        if self.dialog1 is not None and self.dialog1.winfo_exists():
-            self.dialog1.lift()
-            return
-            
-        self.dialog1 = tk.Toplevel(self.root)
-        self.dialog1.title("Перший діалог")
-        self.dialog1.geometry("280x130")
-        self.dialog1.resizable(False, False)
-        self.dialog1.grab_set()
-        
-        self.center_window(self.dialog1, 280, 130)
-        
-        label = tk.Label(self.dialog1, text="Це перший діалог")
-        label.pack(pady=10)
-        
-        button_frame = tk.Frame(self.dialog1)
-        button_frame.pack(pady=10)
-        
-        next_btn = tk.Button(button_frame, text="Далі >", width=15, height=2,
-                            font=("Arial", 10), command=self.open_second_dialog)
-        next_btn.pack(side=tk.LEFT, padx=10)
-        
-        def on_cancel1():
-            self.status_display.config(text="Перший діалог скасовано")
-            self.dialog1.destroy()
-        
-        cancel_btn = tk.Button(button_frame, text="Відміна", width=15, height=2,
-                              font=("Arial", 10), command=on_cancel1)
-        cancel_btn.pack(side=tk.LEFT, padx=10)
+        self.wizard.start()
     
-    def open_second_dialog(self):
-        if self.dialog1 and self.dialog1.winfo_exists():
-            self.dialog1.withdraw()
-        
-        self.dialog2 = tk.Toplevel(self.root)
-        self.dialog2.title("Другий діалог")
-        self.dialog2.geometry("380x130")
-        self.dialog2.resizable(False, False)
-        self.dialog2.grab_set()
-        
-        self.center_window(self.dialog2, 380, 130)
-        
-        label = tk.Label(self.dialog2, text="Це другий діалог")
-        label.pack(pady=10)
-        
-        button_frame = tk.Frame(self.dialog2)
-        button_frame.pack(pady=10)
-        
-        def go_back():
-            self.dialog2.destroy()
-            if self.dialog1 and self.dialog1.winfo_exists():
-                self.dialog1.deiconify()
-                self.dialog1.grab_set()
-        
-        back_btn = tk.Button(button_frame, text="< Назад", width=12, height=2,
-                            font=("Arial", 10), command=go_back)
-        back_btn.pack(side=tk.LEFT, padx=5)
-        
-        def on_ok2():
-            self.status_display.config(text="Другий діалог завершено успішно!")
-            self.dialog2.destroy()
-            if self.dialog1 and self.dialog1.winfo_exists():
-                self.dialog1.destroy()
-        
-        ok_btn = tk.Button(button_frame, text="Так", width=12, height=2,
-                          font=("Arial", 10), command=on_ok2)
-        ok_btn.pack(side=tk.LEFT, padx=5)
-        
-        def on_cancel2():
-            self.status_display.config(text="Другий діалог скасовано")
-            self.dialog2.destroy()
-            if self.dialog1 and self.dialog1.winfo_exists():
-                self.dialog1.destroy()
-        
-        cancel_btn = tk.Button(button_frame, text="Відміна", width=12, height=2,
-                              font=("Arial", 10), command=on_cancel2)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
+    def on_wizard_finish(self):
+        self.set_status("Другий діалог завершено успішно!")
+    
+    def set_status(self, text):
+        self.status_display.config(text=text)
     
     def run(self):
         self.root.mainloop()
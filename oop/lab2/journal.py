@@ -0,0 +1,59 @@
+"""
+Журнал скасування/повторення: записи-дельти фіксованої ширини в масивах array
+Кожен запис - код операції та сім цілих, а не знімок об'єктів
+"""
+
+from array import array
+from typing import Optional, Tuple
+
+ADD, ERASE, CLEAR = range(3)
+
+# код, номер фігури (для CLEAR - попередній start), тип, x1, y1, x2, y2
+# для CLEAR у полі типу зберігається кількість видимих фігур до очищення
+RECORD = 7
+
+Record = Tuple[int, int, int, int, int, int, int]
+
+
+class EditJournal:
+    def __init__(self):
+        self.undo_log = array('i')
+        self.redo_log = array('i')
+
+    def record(self, op: int, index: int, kind: int = 0,
+               x1: int = 0, y1: int = 0, x2: int = 0, y2: int = 0) -> None:
+        self.undo_log.extend((op, index, kind, x1, y1, x2, y2))
+        del self.redo_log[:]
+
+    @staticmethod
+    def _pop(log: array) -> Optional[Record]:
+        if not log:
+            return None
+        record = tuple(log[-RECORD:])
+        del log[-RECORD:]
+        return record
+
+    def undo(self) -> Optional[Record]:
+        record = self._pop(self.undo_log)
+        if record is not None:
+            self.redo_log.extend(record)
+        return record
+
+    def redo(self) -> Optional[Record]:
+        record = self._pop(self.redo_log)
+        if record is not None:
+            self.undo_log.extend(record)
+        return record
+
+    def can_undo(self) -> bool:
+        return bool(self.undo_log)
+
+    def can_redo(self) -> bool:
+        return bool(self.redo_log)
+
+    def clear(self) -> None:
+        del self.undo_log[:]
+        del self.redo_log[:]
+
+    def nbytes(self) -> int:
+        return (len(self.undo_log) + len(self.redo_log)) * self.undo_log.itemsize
@@ -1,10 +1,19 @@
 import tkinter as tk
 from tkinter import messagebox
+from array import array
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Optional, Tuple, Type
+
+from shape_store import ShapeStore, POINT, LINE, RECT, ELLIPSE
+from spatial_index import GridIndex
+from journal import EditJournal, ADD, ERASE, CLEAR
 
 
 class Shape(ABC):
+    __slots__ = ('start_x', 'start_y', 'end_x', 'end_y')
+    KIND = -1
+    
     def __init__(self):
         self.start_x: Optional[int] = None
         self.start_y: Optional[int] = None
@@ -12,92 +21,140 @@ class Shape(ABC):
         self.end_y: Optional[int] = None
     
     @abstractmethod
-    def draw(self, canvas: tk.Canvas) -> None:
+    def draw(self, canvas: tk.Canvas) -> Optional[int]:
+        pass
+    
+    @abstractmethod
+    def draw_rubber(self, canvas: tk.Canvas) -> Optional[int]:
         pass
     
     @abstractmethod
-    def draw_rubber(self, canvas: tk.Canvas) -> None:
+    def rubber_coords(self) -> Optional[Tuple[int, int, int, int]]:
         pass
     
     def set_coords(self, x1: int, y1: int, x2: int, y2: int) -> None:
         self.start_x, self.start_y = x1, y1
         self.end_x, self.end_y = x2, y2
+    
+    def to_row(self) -> Tuple[int, int, int, int, int]:
+        return (self.KIND, self.start_x, self.start_y, self.end_x, self.end_y)
 
 
 class PointShape(Shape):
-    def draw(self, canvas: tk.Canvas) -> None:
+    __slots__ = ()
+    KIND = POINT
+    
+    def draw(self, canvas: tk.Canvas) -> Optional[int]:
         if self.start_x is not None and self.start_y is not None:
             r = 3
-            canvas.create_oval(
+            return canvas.create_oval(
                 self.start_x - r, self.start_y - r,
                 self.start_x + r, self.start_y + r,
                 fill='black', outline='black'
             )
+        return None
     
-    def draw_rubber(self, canvas: tk.Canvas) -> None:
+    def rubber_coords(self) -> Optional[Tuple[int, int, int, int]]:
         if self.end_x is not None and self.end_y is not None:
             r = 3
-            canvas.create_oval(
-                self.end_x - r, self.end_y - r,
-                self.end_x + r, self.end_y + r,
-                outline='black', dash=(2, 2)
-            )
+            return (self.end_x - r, self.end_y - r,
+                    self.end_x + r, self.end_y + r)
+        return None
+    
+    def draw_rubber(self, canvas: tk.Canvas) -> Optional[int]:
+        coords = self.rubber_coords()
+        if coords is None:
+            return None
+        return canvas.create_oval(*coords, outline='black', dash=(2, 2))
 
 
 class LineShape(Shape):
-    def draw(self, canvas: tk.Canvas) -> None:
+    __slots__ = ()
+    KIND = LINE
+    
+    def draw(self, canvas: tk.Canvas) -> Optional[int]:
         if all([self.start_x, self.start_y, self.end_x, self.end_y]):
-            canvas.create_line(
+            return canvas.create_line(
                 self.start_x, self.start_y,
                 self.end_x, self.end_y,
                 fill='black', width=2
             )
+        return None
     
-    def draw_rubber(self, canvas: tk.Canvas) -> None:
+    def rubber_coords(self) -> Optional[Tuple[int, int, int, int]]:
         if all([self.start_x, self.start_y, self.end_x, self.end_y]):
-            canvas.create_line(
-                self.start_x, self.start_y,
-                self.end_x, self.end_y,
-                fill='black', dash=(4, 4)
-            )
+            return (self.start_x, self.start_y, self.end_x, self.end_y)
+        return None
+    
+    def draw_rubber(self, canvas: tk.Canvas) -> Optional[int]:
+        coords = self.rubber_coords()
+        if coords is None:
+            return None
+        return canvas.create_line(*coords, fill='black', dash=(4, 4))
 
 
 class RectShape(Shape):
-    def draw(self, canvas: tk.Canvas) -> None:
+    __slots__ = ()
+    KIND = RECT
+    
+    def draw(self, canvas: tk.Canvas) -> Optional[int]:
         if all([self.start_x, self.start_y, self.end_x, self.end_y]):
-            canvas.create_rectangle(
+            return canvas.create_rectangle(
                 self.start_x, self.start_y,
                 self.end_x, self.end_y,
                 outline='black', fill='#00FF00', width=2
             )
+        return None
     
-    def draw_rubber(self, canvas: tk.Canvas) -> None:
+    def rubber_coords(self) -> Optional[Tuple[int, int, int, int]]:
         if all([self.start_x, self.start_y, self.end_x, self.end_y]):
-            canvas.create_rectangle(
-                self.start_x, self.start_y,
-                self.end_x, self.end_y,
-                outline='black', dash=(4, 4)
-            )
+            return (self.start_x, self.start_y, self.end_x, self.end_y)
+        return None
+    
+    def draw_rubber(self, canvas: tk.Canvas) -> Optional[int]:
+        coords = self.rubber_coords()
+        if coords is None:
+            return None
+        return canvas.create_rectangle(*coords, outline='black', dash=(4, 4))
 
 
 class EllipseShape(Shape):
-    def draw(self, canvas: tk.Canvas) -> None:
+    __slots__ = ()
+    KIND = ELLIPSE
+    
+    def draw(self, canvas: tk.Canvas) -> Optional[int]:
         if all([self.start_x, self.start_y, self.end_x, self.end_y]):
             x1 = 2 * self.start_x - self.end_x
             y1 = 2 * self.start_y - self.end_y
-            canvas.create_oval(
+            return canvas.create_oval(
                 x1, y1, self.end_x, self.end_y,
                 outline='black', fill='white', width=2
             )
+        return None
     
-    def draw_rubber(self, canvas: tk.Canvas) -> None:
+    def rubber_coords(self) -> Optional[Tuple[int, int, int, int]]:
         if all([self.start_x, self.start_y, self.end_x, self.end_y]):
             x1 = 2 * self.start_x - self.end_x
             y1 = 2 * self.start_y - self.end_y
-            canvas.create_oval(
-                x1, y1, self.end_x, self.end_y,
-                outline='black', dash=(4, 4)
-            )
+            return (x1, y1, self.end_x, self.end_y)
+        return None
+    
+    def draw_rubber(self, canvas: tk.Canvas) -> Optional[int]:
+        coords = self.rubber_coords()
+        if coords is None:
+            return None
+        return canvas.create_oval(*coords, outline='black', dash=(4, 4))
+
+
+SHAPE_TYPES: Dict[int, Type[Shape]] = {
+    cls.KIND: cls for cls in (PointShape, LineShape, RectShape, EllipseShape)
+}
+
+
+def shape_view(kind: int, x1: int, y1: int, x2: int, y2: int) -> Shape:
+    shape = SHAPE_TYPES[kind]()
+    shape.set_coords(x1, y1, x2, y2)
+    return shape
 
 
 class Editor(ABC):
@@ -203,16 +260,29 @@ class EllipseEditor(Editor):
 
 
 class ShapeEditorApp:
-    MAX_SHAPES = 111
+    FRAME_RATES = (60, 120)
     
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Lab2 - Графічний редактор")
         self.root.geometry("900x700")
         
-        self.shapes: List[Optional[Shape]] = [None] * self.MAX_SHAPES
-        self.shape_count = 0
+        self.store = ShapeStore()
+        self.index = GridIndex()
+        self.journal = EditJournal()
+        self.item_ids = array('i')
         self.current_editor: Optional[Editor] = None
+        self.current_tool: Optional[str] = None
+        self.rubber_id: Optional[int] = None
+        self.selection_id: Optional[int] = None
+        self.selected: Optional[int] = None
+        
+        self.frame_rate = tk.IntVar(value=self.FRAME_RATES[0])
+        self.pending_motion: Optional[Tuple[int, int]] = None
+        self.frame_job: Optional[str] = None
+        self.last_frame = 0.0
+        self.motion_events = 0
+        self.frames_rendered = 0
         self.current_mode = "Без режиму"
         
         self._create_menu()
@@ -224,6 +294,11 @@ class ShapeEditorApp:
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
+        edit_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Правка", menu=edit_menu)
+        edit_menu.add_command(label="Скасувати", accelerator="Ctrl+Z", command=self._undo)
+        edit_menu.add_command(label="Повторити", accelerator="Ctrl+Y", command=self._redo)
+        
         objects_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Об'єкти", menu=objects_menu)
         objects_menu.add_command(label="Точка", command=self._set_point_mode)
@@ -231,8 +306,17 @@ class ShapeEditorApp:
         objects_menu.add_command(label="Прямокутник", command=self._set_rect_mode)
         objects_menu.add_command(label="Еліпс", command=self._set_ellipse_mode)
         objects_menu.add_separator()
+        objects_menu.add_command(label="Вибрати", command=self._set_pick_mode)
+        objects_menu.add_command(label="Стерти", command=self._set_erase_mode)
+        objects_menu.add_separator()
         objects_menu.add_command(label="Очистити все", command=self._clear_all)
         
+        view_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Вигляд", menu=view_menu)
+        for rate in self.FRAME_RATES:
+            view_menu.add_radiobutton(label=f"{rate} кадрів/с", value=rate,
+                                      variable=self.frame_rate)
+        
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Довідка", menu=help_menu)
         help_menu.add_command(label="Про програму", command=self._show_about)
@@ -245,68 +329,226 @@ class ShapeEditorApp:
         self.canvas.bind("<Button-1>", self._on_mouse_down)
         self.canvas.bind("<B1-Motion>", self._on_mouse_move)
         self.canvas.bind("<ButtonRelease-1>", self._on_mouse_up)
+        self.root.bind("<Control-z>", lambda event: self._undo())
+        self.root.bind("<Control-y>", lambda event: self._redo())
     
     def _update_title(self) -> None:
-        title = f"Lab2 - {self.current_mode} | Фігур: {self.shape_count}/{self.MAX_SHAPES}"
+        title = f"Lab2 - {self.current_mode} | Фігур: {self.store.live_count}"
+        if self.selected is not None:
+            title += f" | Вибрано: #{self.selected}"
+        if self.motion_events:
+            title += f" | Події/кадри: {self.motion_events}/{self.frames_rendered}"
         self.root.title(title)
     
     def _set_point_mode(self) -> None:
         self.current_editor = PointEditor()
+        self.current_tool = None
         self.current_mode = "Режим введення точок"
         self._update_title()
     
     def _set_line_mode(self) -> None:
         self.current_editor = LineEditor()
+        self.current_tool = None
         self.current_mode = "Режим введення ліній"
         self._update_title()
     
     def _set_rect_mode(self) -> None:
         self.current_editor = RectEditor()
+        self.current_tool = None
         self.current_mode = "Режим введення прямокутників"
         self._update_title()
     
     def _set_ellipse_mode(self) -> None:
         self.current_editor = EllipseEditor()
+        self.current_tool = None
         self.current_mode = "Режим введення еліпсів"
         self._update_title()
     
+    def _set_pick_mode(self) -> None:
+        self.current_editor = None
+        self.current_tool = "pick"
+        self.current_mode = "Режим вибору"
+        self._update_title()
+    
+    def _set_erase_mode(self) -> None:
+        self.current_editor = None
+        self.current_tool = "erase"
+        self.current_mode = "Режим стирання"
+        self._update_title()
+    
     def _on_mouse_down(self, event) -> None:
-        if self.current_editor and self.shape_count < self.MAX_SHAPES:
+        if self.current_tool == "pick":
+            self._select(self.index.pick(event.x, event.y))
+        elif self.current_tool == "erase":
+            self._erase_at(event.x, event.y)
+        elif self.current_editor:
             self.current_editor.on_mouse_down(event.x, event.y)
     
     def _on_mouse_move(self, event) -> None:
         if self.current_editor and self.current_editor.is_drawing:
-            self.current_editor.on_mouse_move(event.x, event.y)
-            self._redraw()
+            self.motion_events += 1
+            self.pending_motion = (event.x, event.y)
+            if self.frame_job is None:
+                interval = 1.0 / self.frame_rate.get()
+                delay = self.last_frame + interval - time.perf_counter()
+                self.frame_job = self.root.after(max(0, int(delay * 1000)), self._render_frame)
+    
+    def _render_frame(self) -> None:
+        self.frame_job = None
+        if self.pending_motion is None:
+            return
+        x, y = self.pending_motion
+        self.pending_motion = None
+        if self.current_editor and self.current_editor.is_drawing:
+            self.current_editor.on_mouse_move(x, y)
+            self._update_rubber()
+            self.frames_rendered += 1
+        self.last_frame = time.perf_counter()
+    
+    def _cancel_frame(self) -> None:
+        if self.frame_job is not None:
+            self.root.after_cancel(self.frame_job)
+            self.frame_job = None
+        self.pending_motion = None
     
     def _on_mouse_up(self, event) -> None:
+        self._cancel_frame()
         if self.current_editor and self.current_editor.is_drawing:
             new_shape = self.current_editor.on_mouse_up(event.x, event.y)
-            if new_shape and self.shape_count < self.MAX_SHAPES:
-                self.shapes[self.shape_count] = new_shape
-                self.shape_count += 1
+            self._remove_rubber()
+            if new_shape:
+                index = self._add_shape(new_shape)
+                self.journal.record(ADD, index, *new_shape.to_row())
                 self._update_title()
-                self._redraw()
-            elif self.shape_count >= self.MAX_SHAPES:
-                messagebox.showwarning("Увага", f"Досягнуто максимум ({self.MAX_SHAPES} фігур)")
+    
+    def _add_shape(self, shape: Shape) -> int:
+        index = self.store.append(*shape.to_row())
+        self.item_ids.append(shape.draw(self.canvas) or 0)
+        self.index.insert(index, self.store.bounds(index))
+        return index
+    
+    def _remove_last_shape(self) -> None:
+        index = len(self.store) - 1
+        if index == self.selected:
+            self._select(None)
+        if self.store.is_alive(index):
+            self.index.remove(index)
+        self.canvas.delete(self.item_ids.pop())
+        self.store.pop()
+    
+    def _restore_shape(self, index: int) -> None:
+        self.store.revive(index)
+        self.index.insert(index, self.store.bounds(index))
+        self.item_ids[index] = shape_view(*self.store.row(index)).draw(self.canvas) or 0
+    
+    def _erase_at(self, x: int, y: int) -> None:
+        index = self.index.pick(x, y)
+        if index is None:
+            return
+        self.journal.record(ERASE, index)
+        self._erase(index)
+        self._update_title()
+    
+    def _erase(self, index: int) -> None:
+        self.store.erase(index)
+        self.index.remove(index)
+        self.canvas.delete(self.item_ids[index])
+        self.item_ids[index] = 0
+        if index == self.selected:
+            self._select(None)
+    
+    def _select(self, index: Optional[int]) -> None:
+        self.selected = index
+        if index is None:
+            if self.selection_id is not None:
+                self.canvas.delete(self.selection_id)
+                self.selection_id = None
+        else:
+            left, top, right, bottom = self.store.bounds(index)
+            coords = (left - 2, top - 2, right + 2, bottom + 2)
+            if self.selection_id is None:
+                self.selection_id = self.canvas.create_rectangle(
+                    *coords, outline='red', dash=(2, 2)
+                )
+            else:
+                self.canvas.coords(self.selection_id, *coords)
+                self.canvas.tag_raise(self.selection_id)
+        self._update_title()
+    
+    def _update_rubber(self) -> None:
+        shape = self.current_editor.current_shape
+        if shape is None:
+            return
+        if self.rubber_id is None:
+            self.rubber_id = shape.draw_rubber(self.canvas)
+        else:
+            coords = shape.rubber_coords()
+            if coords is not None:
+                self.canvas.coords(self.rubber_id, *coords)
+    
+    def _remove_rubber(self) -> None:
+        if self.rubber_id is not None:
+            self.canvas.delete(self.rubber_id)
+            self.rubber_id = None
     
     def _redraw(self) -> None:
         self.canvas.delete("all")
+        self.rubber_id = None
+        self.selection_id = None
+        self.selected = None
         
-        for i in range(self.shape_count):
-            if self.shapes[i]:
-                self.shapes[i].draw(self.canvas)
+        self.item_ids = array('i', bytes(self.item_ids.itemsize * len(self.store)))
+        for index, row in self.store.live_rows():
+            self.item_ids[index] = shape_view(*row).draw(self.canvas) or 0
         
         if self.current_editor and self.current_editor.is_drawing:
-            if self.current_editor.current_shape:
-                self.current_editor.current_shape.draw_rubber(self.canvas)
+            self._update_rubber()
     
     def _clear_all(self) -> None:
         if messagebox.askyesno("Підтвердження", "Очистити всі фігури?"):
-            self.shapes = [None] * self.MAX_SHAPES
-            self.shape_count = 0
+            start, live_count = self.store.clear()
+            self.journal.record(CLEAR, start, live_count)
+            self.index.clear()
+            self._redraw()
             self._update_title()
+    
+    def _unclear(self, start: int, live_count: int) -> None:
+        self.store.restore(start, live_count)
+        for index, _ in self.store.live_rows():
+            self.index.insert(index, self.store.bounds(index))
+        self._redraw()
+    
+    def _undo(self) -> None:
+        if self.current_editor and self.current_editor.is_drawing:
+            return
+        record = self.journal.undo()
+        if record is None:
+            return
+        op, index, kind = record[:3]
+        if op == ADD:
+            self._remove_last_shape()
+        elif op == ERASE:
+            self._restore_shape(index)
+        elif op == CLEAR:
+            self._unclear(index, kind)
+        self._update_title()
+    
+    def _redo(self) -> None:
+        if self.current_editor and self.current_editor.is_drawing:
+            return
+        record = self.journal.redo()
+        if record is None:
+            return
+        op, index = record[:2]
+        if op == ADD:
+            self._add_shape(shape_view(*record[2:]))
+        elif op == ERASE:
+            self._erase(index)
+        elif op == CLEAR:
+            self.store.clear()
+            self.index.clear()
             self._redraw()
+        self._update_title()
     
     def _show_about(self) -> None:
         about_text = """Лабораторна робота №2
@@ -316,7 +558,7 @@ class ShapeEditorApp:
 Група: ІМ-44, Номер: 11
 
 Параметри (Ж=11):
-• Статичний масив: 111 елементів
+• Сховище фігур: стовпці array без обмеження кількості
 • Гумовий слід: пунктирна чорна лінія
 • Прямокутник: світло-зелене заповнення
 • Еліпс: введення від центру, біле заповнення
@@ -0,0 +1,166 @@
+"""
+Стовпцеве сховище фігур: код типу та чотири координати в окремих масивах array
+Додавання - амортизовано O(1); NumPy (якщо встановлений) використовується для запитів
+"""
+
+from array import array
+from typing import Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # без NumPy запити виконуються звичайним циклом
+    np = None
+
+
+POINT, LINE, RECT, ELLIPSE = range(4)
+POINT_RADIUS = 3
+
+Row = Tuple[int, int, int, int, int]
+Bounds = Tuple[int, int, int, int]
+
+
+def shape_bounds(kind: int, x1: int, y1: int, x2: int, y2: int) -> Bounds:
+    if kind == POINT:
+        r = POINT_RADIUS
+        return x1 - r, y1 - r, x1 + r, y1 + r
+    if kind == ELLIPSE:
+        x1, y1 = 2 * x1 - x2, 2 * y1 - y2
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+class ShapeStore:
+    def __init__(self):
+        self.kinds = array('b')
+        self.x1 = array('i')
+        self.y1 = array('i')
+        self.x2 = array('i')
+        self.y2 = array('i')
+        # Стерті фігури лишаються на місці (0 у alive), щоб номери фігур не зсувалися
+        self.alive = bytearray()
+        self.live_count = 0
+        # "Очистити все" лише пересуває початок: рядки до start невидимі, але їх можна повернути
+        self.start = 0
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def append(self, kind: int, x1: int, y1: int, x2: int, y2: int) -> int:
+        self.kinds.append(kind)
+        self.x1.append(x1)
+        self.y1.append(y1)
+        self.x2.append(x2)
+        self.y2.append(y2)
+        self.alive.append(1)
+        self.live_count += 1
+        return len(self.kinds) - 1
+
+    def pop(self) -> Row:
+        row = self.row(-1)
+        for column in (self.kinds, self.x1, self.y1, self.x2, self.y2):
+            column.pop()
+        if self.alive.pop():
+            self.live_count -= 1
+        return row
+
+    def erase(self, index: int) -> None:
+        if self.alive[index]:
+            self.alive[index] = 0
+            self.live_count -= 1
+
+    def revive(self, index: int) -> None:
+        if not self.alive[index]:
+            self.alive[index] = 1
+            self.live_count += 1
+
+    def is_alive(self, index: int) -> bool:
+        return index >= self.start and bool(self.alive[index])
+
+    def row(self, index: int) -> Row:
+        return (self.kinds[index], self.x1[index], self.y1[index],
+                self.x2[index], self.y2[index])
+
+    def rows(self) -> Iterator[Row]:
+        return zip(self.kinds, self.x1, self.y1, self.x2, self.y2)
+
+    def live_rows(self) -> Iterator[Tuple[int, Row]]:
+        alive = self.alive
+        for index in range(self.start, len(self.kinds)):
+            if alive[index]:
+                yield index, self.row(index)
+
+    def bounds(self, index: int) -> Bounds:
+        return shape_bounds(*self.row(index))
+
+    def clear(self) -> Tuple[int, int]:
+        """Ховає всі фігури за O(1); повертає (start, live_count) для restore"""
+        previous = self.start, self.live_count
+        self.start = len(self.kinds)
+        self.live_count = 0
+        return previous
+
+    def restore(self, start: int, live_count: int) -> None:
+        self.start = start
+        self.live_count = live_count
+
+    def reset(self) -> None:
+        """Справжнє звільнення пам'яті: видаляє всі рядки, включно з очищеними"""
+        for column in (self.kinds, self.x1, self.y1, self.x2, self.y2):
+            del column[:]
+        del self.alive[:]
+        self.live_count = 0
+        self.start = 0
+
+    def nbytes(self) -> int:
+        return sum(column.itemsize * len(column)
+                   for column in (self.kinds, self.x1, self.y1, self.x2, self.y2)) + len(self.alive)
+
+    # ---------- Векторні запити ----------
+    # Масиви NumPy тут - лише тимчасові представлення над буферами array:
+    # поки такий масив живий, array не може змінити розмір, тож назовні вони не віддаються.
+    def _np_bounds(self):
+        kinds = np.frombuffer(self.kinds, dtype=np.int8)
+        x1 = np.frombuffer(self.x1, dtype=np.int32).astype(np.int64)
+        y1 = np.frombuffer(self.y1, dtype=np.int32).astype(np.int64)
+        x2 = np.frombuffer(self.x2, dtype=np.int32).astype(np.int64)
+        y2 = np.frombuffer(self.y2, dtype=np.int32).astype(np.int64)
+
+        ellipse = kinds == ELLIPSE
+        x1 = np.where(ellipse, 2 * x1 - x2, x1)
+        y1 = np.where(ellipse, 2 * y1 - y2, y1)
+        left, right = np.minimum(x1, x2), np.maximum(x1, x2)
+        top, bottom = np.minimum(y1, y2), np.maximum(y1, y2)
+
+        point = kinds == POINT
+        r = POINT_RADIUS
+        left = np.where(point, x1 - r, left)
+        right = np.where(point, x1 + r, right)
+        top = np.where(point, y1 - r, top)
+        bottom = np.where(point, y1 + r, bottom)
+        return left, top, right, bottom
+
+    def count_by_kind(self) -> List[int]:
+        if np is not None and self.live_count:
+            kinds = np.frombuffer(self.kinds, dtype=np.int8)
+            alive = np.frombuffer(self.alive, dtype=np.uint8).astype(bool)
+            alive[:self.start] = False
+            counts = np.bincount(kinds[alive], minlength=4)
+            return [int(c) for c in counts[:4]]
+        counts = [0, 0, 0, 0]
+        for _, row in self.live_rows():
+            counts[row[0]] += 1
+        return counts
+
+    def find_in_rect(self, left: int, top: int, right: int, bottom: int) -> List[int]:
+        """Номери фігур, чиї габарити перетинають прямокутник"""
+        if np is not None and len(self):
+            l, t, r, b = self._np_bounds()
+            hits = (l <= right) & (r >= left) & (t <= bottom) & (b >= top)
+            hits &= np.frombuffer(self.alive, dtype=np.uint8).astype(bool)
+            hits[:self.start] = False
+            return np.flatnonzero(hits).tolist()
+        found = []
+        for index, row in self.live_rows():
+            l, t, r, b = shape_bounds(*row)
+            if l <= right and r >= left and t <= bottom and b >= top:
+                found.append(index)
+        return found
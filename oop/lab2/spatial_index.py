@@ -0,0 +1,103 @@
+"""
+Просторовий індекс фігур: рівномірна сітка клітинок над габаритами
+Пошук фігури під курсором переглядає лише одну клітинку, а не всі фігури
+"""
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+Bounds = Tuple[int, int, int, int]
+
+
+class GridIndex:
+    CELL_SIZE = 64
+    # Фігура, що накриває більше клітинок, іде до окремого списку великих фігур
+    MAX_CELLS = 64
+
+    def __init__(self, cell_size: int = CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], array] = {}
+        self.large = array('i')
+        self.left = array('i')
+        self.top = array('i')
+        self.right = array('i')
+        self.bottom = array('i')
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _cell_range(self, bounds: Bounds):
+        size = self.cell_size
+        left, top, right, bottom = bounds
+        return range(left // size, right // size + 1), range(top // size, bottom // size + 1)
+
+    def insert(self, index: int, bounds: Bounds) -> None:
+        columns, rows = self._cell_range(bounds)
+        if len(columns) * len(rows) > self.MAX_CELLS:
+            self.large.append(index)
+        else:
+            for cx in columns:
+                for cy in rows:
+                    cell = self.cells.get((cx, cy))
+                    if cell is None:
+                        cell = self.cells[(cx, cy)] = array('i')
+                    cell.append(index)
+
+        while len(self.left) <= index:
+            for column in (self.left, self.top, self.right, self.bottom):
+                column.append(0)
+            self.left[-1] = 1  # порожній слот: left > right
+        self.left[index], self.top[index], self.right[index], self.bottom[index] = bounds
+        self.count += 1
+
+    def remove(self, index: int) -> None:
+        bounds = self.bounds(index)
+        if bounds is None:
+            return
+        columns, rows = self._cell_range(bounds)
+        if len(columns) * len(rows) > self.MAX_CELLS:
+            self.large.remove(index)
+        else:
+            for cx in columns:
+                for cy in rows:
+                    cell = self.cells[(cx, cy)]
+                    cell.remove(index)
+                    if not cell:
+                        del self.cells[(cx, cy)]
+        self.left[index], self.right[index] = 1, 0
+        self.count -= 1
+
+    def bounds(self, index: int) -> Optional[Bounds]:
+        if index >= len(self.left) or self.left[index] > self.right[index]:
+            return None
+        return self.left[index], self.top[index], self.right[index], self.bottom[index]
+
+    def clear(self) -> None:
+        self.cells.clear()
+        for column in (self.large, self.left, self.top, self.right, self.bottom):
+            del column[:]
+        self.count = 0
+
+    def _contains(self, index: int, x: int, y: int) -> bool:
+        return (self.left[index] <= x <= self.right[index]
+                and self.top[index] <= y <= self.bottom[index])
+
+    def query_point(self, x: int, y: int) -> List[int]:
+        """Усі фігури, чиї габарити містять точку, у порядку додавання"""
+        cell = self.cells.get((x // self.cell_size, y // self.cell_size), ())
+        hits = [i for i in cell if self._contains(i, x, y)]
+        hits.extend(i for i in self.large if self._contains(i, x, y))
+        hits.sort()
+        return hits
+
+    def pick(self, x: int, y: int) -> Optional[int]:
+        """Верхня (остання додана) фігура під точкою"""
+        best = -1
+        for i in self.cells.get((x // self.cell_size, y // self.cell_size), ()):
+            if i > best and self._contains(i, x, y):
+                best = i
+        for i in self.large:
+            if i > best and self._contains(i, x, y):
+                best = i
+        return best if best >= 0 else None
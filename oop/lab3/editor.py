@@ -1,11 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from shapes.factory import ShapeFactory
-from utils import create_tooltip
+from utils import create_tooltip, RasterLayer, LodRenderer
 
 
 class GraphicEditor:
-    MAX_SHAPES = 112
+    VECTOR_ITEM_BUDGET = 5000
 
     SHAPES_CONFIG = {
         'point': {'name': 'Крапка', 'icon': '•'},
@@ -20,9 +20,12 @@ class GraphicEditor:
         self.root.title("Графічний редактор Lab3")
         self.root.geometry("1000x700")
 
-        self.shapes = []
+        self.lod = LodRenderer()
+        self.shapes = self.lod.shapes
+        self.items_since_redraw = 0
         self.current_shape_type = 'point'
         self.current_shape = None
+        self.move_handler = self._idle_move
 
         self.setup_menu()
         self.setup_toolbar()
@@ -34,6 +37,7 @@ class GraphicEditor:
         self.root.config(menu=menubar)
 
         file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Перемалювати", command=self.redraw)
         file_menu.add_command(label="Очистити", command=self.clear_canvas)
         file_menu.add_separator()
         file_menu.add_command(label="Вихід", command=self.root.quit)
@@ -84,6 +88,14 @@ class GraphicEditor:
         self.canvas.bind('<B1-Motion>', self.on_mouse_move)
         self.canvas.bind('<ButtonRelease-1>', self.on_mouse_up)
 
+        self.raster = None
+        if RasterLayer.available():
+            self.raster = RasterLayer(self.canvas, 1000, 700)
+            self.canvas.bind('<Configure>', self.on_canvas_resize)
+
+    def on_canvas_resize(self, event):
+        self.raster.resize(event.width, event.height)
+
     def setup_statusbar(self):
         bar = ttk.Frame(self.root, relief=tk.SUNKEN, borderwidth=1)
         bar.pack(side=tk.BOTTOM, fill=tk.X)
@@ -108,30 +120,75 @@ class GraphicEditor:
 
     def on_mouse_down(self, event):
         self.current_shape = ShapeFactory.create_shape(self.current_shape_type, event.x, event.y)
+        self.move_handler = self._make_move_handler(self.current_shape, self.canvas)
+
+    def _make_move_handler(self, shape, canvas):
+        update = shape.update
+        show_rubber = shape.show_rubber
+
+        def handler(event):
+            update(event.x, event.y)
+            show_rubber(canvas)
+        return handler
+
+    def _idle_move(self, event):
+        pass
 
     def on_mouse_move(self, event):
-        getattr(self.current_shape, 'update', lambda x, y: None)(event.x, event.y)
-        getattr(self.current_shape, 'show_rubber', lambda canvas: None)(self.canvas)
+        self.move_handler(event)
 
     def on_mouse_up(self, event):
         update_and_finalize = lambda shape: (
             shape.update(event.x, event.y),
-            shape.finalize(self.canvas),
-            self.shapes.append(shape),
-            self.update_shapes_count()
+            shape.finalize(self.canvas, self.raster),
+            self.lod.add(shape),
+            self.after_finalize()
         )
-        update_and_finalize(self.current_shape) if self.current_shape and len(self.shapes) < self.MAX_SHAPES else \
-            messagebox.showwarning("Обмеження", f"Досягнуто максимум — {self.MAX_SHAPES} об'єктів") if self.current_shape else None
+        update_and_finalize(self.current_shape) if self.current_shape else None
         self.current_shape = None
-
+        self.move_handler = self._idle_move
+
+    def after_finalize(self):
+        if self.raster is None:
+            # бюджет рахує лише фігури, додані після останнього перемальовування:
+            # план LOD сам може мати більше елементів, ніж бюджет
+            self.items_since_redraw += 1
+            if self.items_since_redraw > self.VECTOR_ITEM_BUDGET:
+                self.redraw()
+        self.update_shapes_count()
+
+    def redraw(self):
+        width = max(self.canvas.winfo_width(), 1)
+        height = max(self.canvas.winfo_height(), 1)
+        if self.raster is not None:
+            self.raster.clear()
+            self.canvas.delete('vector')
+            plan = self.lod.render_raster(self.raster.draw, self.raster.width, self.raster.height)
+            for index in plan.full:
+                shape = self.shapes[index]
+                if shape.draw_raster is None:
+                    self.canvas.addtag_withtag('vector', shape.draw(self.canvas))
+        else:
+            self.canvas.delete('all')
+            plan = self.lod.render_canvas(self.canvas, width, height)
+            self.items_since_redraw = 0
+        self.status_label.config(
+            text=f"Перемальовано: {len(plan.full)} фігур, {len(plan.points)} точок, "
+                 f"{len(plan.dense)} щільних ділянок"
+        )
 
     def update_shapes_count(self):
-        self.shapes_count_label.config(text=f"Об'єктів: {len(self.shapes)}/{self.MAX_SHAPES}")
+        self.shapes_count_label.config(text=f"Об'єктів: {len(self.shapes)}")
 
     def clear_canvas(self):
         if messagebox.askyesno("Підтвердження", "Очистити полотно?"):
-            self.shapes.clear()
-            self.canvas.delete('all')
+            self.lod.clear()
+            self.items_since_redraw = 0
+            if self.raster is not None:
+                self.raster.clear()
+                self.canvas.delete('vector')
+            else:
+                self.canvas.delete('all')
             self.update_shapes_count()
             self.status_label.config(text="Полотно очищено")
 
@@ -140,7 +197,7 @@ class GraphicEditor:
 
 Варіант завдання:
 Тип масиву: Динамічний (Shape **pcshape)
-Кількість елементів: 112
+Кількість елементів: без обмеження (рівні деталізації)
 
 Гумовий слід: суцільна чорна лінія
 Прямокутник: чорний контур, жовте заповнення
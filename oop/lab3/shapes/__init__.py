@@ -1,7 +1,17 @@
-from .point import Point
-from .line import Line
-from .rectangle import Rectangle
-from .ellipse import Ellipse
-from .star import Star
+from .registry import ShapeRegistry
 
-__all__ = ["Point", "Line", "Rectangle", "Ellipse", "Star"]
+__all__ = ["Point", "Line", "Rectangle", "Ellipse", "Star", "ShapeRegistry"]
+
+_CLASS_NAMES = {
+    "Point": "point",
+    "Line": "line",
+    "Rectangle": "rectangle",
+    "Ellipse": "ellipse",
+    "Star": "star",
+}
+
+
+def __getattr__(name):
+    if name in _CLASS_NAMES:
+        return ShapeRegistry.get(_CLASS_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,15 +13,29 @@ class Shape(ABC):
         self.x2 = x2
         self.y2 = y2
 
+    def coords(self):
+        return (self.x1, self.y1, self.x2, self.y2)
+
+    def bbox(self):
+        coords = self.coords()
+        xs, ys = coords[0::2], coords[1::2]
+        return (min(xs), min(ys), max(xs), max(ys))
+
     def show_rubber(self, canvas):
-        if self.temp_id:
-            canvas.delete(self.temp_id)
-        self.temp_id = self.draw_rubber(canvas)
+        if self.temp_id is None:
+            self.temp_id = self.draw_rubber(canvas)
+        else:
+            canvas.coords(self.temp_id, *self.coords())
 
-    def finalize(self, canvas):
-        if self.temp_id:
+    def finalize(self, canvas, raster=None):
+        if self.temp_id is not None:
             canvas.delete(self.temp_id)
-        self.draw(canvas)
+            self.temp_id = None
+        if raster is None or not raster.add(self):
+            canvas.addtag_withtag('vector', self.draw(canvas))
+
+    # фігури без растрового малювання (напр. плагіни) лишають None і малюються на полотні
+    draw_raster = None
 
     @abstractmethod
     def draw(self, canvas): ...
@@ -25,3 +25,6 @@ class Ellipse(Shape):
             self.x1, self.y1, self.x2, self.y2,
             outline='black', width=1
         )
+
+    def draw_raster(self, draw):
+        draw.ellipse(self.bbox(), outline='black', width=2)
@@ -6,3 +6,6 @@ class Line(Shape):
 
     def draw_rubber(self, canvas):
         return canvas.create_line(self.x1, self.y1, self.x2, self.y2, fill='black', width=1)
+
+    def draw_raster(self, draw):
+        draw.line(self.coords(), fill='black', width=2)
@@ -1,12 +1,15 @@
 from .base import Shape
 
 class Point(Shape):
-    def draw(self, canvas):
+    def coords(self):
         r = 3
-        return canvas.create_oval(self.x1 - r, self.y1 - r, self.x1 + r, self.y1 + r,
-                                  fill='black', outline='black')
+        return (self.x1 - r, self.y1 - r, self.x1 + r, self.y1 + r)
+
+    def draw(self, canvas):
+        return canvas.create_oval(*self.coords(), fill='black', outline='black')
 
     def draw_rubber(self, canvas):
-        r = 3
-        return canvas.create_oval(self.x1 - r, self.y1 - r, self.x1 + r, self.y1 + r,
-                                  outline='black')
+        return canvas.create_oval(*self.coords(), outline='black')
+
+    def draw_raster(self, draw):
+        draw.ellipse(self.coords(), fill='black', outline='black')
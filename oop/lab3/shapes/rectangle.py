@@ -12,3 +12,6 @@ class Rectangle(Shape):
             self.x1, self.y1, self.x2, self.y2,
             outline='black', width=1
         )
+
+    def draw_raster(self, draw):
+        draw.rectangle(self.bbox(), outline='black', fill='yellow', width=2)
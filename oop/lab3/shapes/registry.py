@@ -0,0 +1,61 @@
+from importlib import import_module
+
+
+class ShapeRegistry:
+    ENTRY_POINT_GROUP = 'lab3.shapes'
+
+    _specs = {
+        'point': '.point:Point',
+        'line': '.line:Line',
+        'rectangle': '.rectangle:Rectangle',
+        'ellipse': '.ellipse:Ellipse',
+        'star': '.star:Star',
+    }
+    _classes = {}
+    _entry_points_loaded = False
+
+    @classmethod
+    def register(cls, name, target):
+        cls._specs[name] = target
+        cls._classes.pop(name, None)
+
+    @classmethod
+    def load_entry_points(cls):
+        if cls._entry_points_loaded:
+            return
+        cls._entry_points_loaded = True
+        from importlib.metadata import entry_points
+        for entry in entry_points(group=cls.ENTRY_POINT_GROUP):
+            cls._specs.setdefault(entry.name, entry.value)
+
+    @classmethod
+    def names(cls):
+        cls.load_entry_points()
+        return list(cls._specs)
+
+    @classmethod
+    def has(cls, name):
+        if name not in cls._specs:
+            cls.load_entry_points()
+        return name in cls._specs
+
+    @classmethod
+    def get(cls, name):
+        shape_class = cls._classes.get(name)
+        if shape_class is not None:
+            return shape_class
+        if not cls.has(name):
+            raise ValueError(f"Unknown shape type: {name}")
+
+        target = cls._specs[name]
+        if isinstance(target, str):
+            module_name, _, attr = target.partition(':')
+            shape_class = getattr(import_module(module_name, __package__), attr)
+        else:
+            shape_class = target
+        cls._classes[name] = shape_class
+        return shape_class
+
+    @classmethod
+    def loaded(cls):
+        return list(cls._classes)
@@ -1,21 +1,74 @@
 import math
+from functools import lru_cache
 from .base import Shape
 
 
+@lru_cache(maxsize=None)
+def _numpy():
+    # власний лінивий імпорт: shapes вантажиться і як shapes, і як lab3.shapes, тож utils.lazy тут недоступний
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@lru_cache(maxsize=None)
+def unit_star(points=5, inner_ratio=0.4):
+    xs = []
+    ys = []
+    for i in range(2 * points):
+        angle = math.pi / 2 + (math.pi * i / points)
+        r = 1.0 if i % 2 == 0 else inner_ratio
+        xs.append(r * math.cos(angle))
+        ys.append(-r * math.sin(angle))
+    return tuple(xs), tuple(ys)
+
+
+@lru_cache(maxsize=None)
+def _unit_star_array(points, inner_ratio):
+    np = _numpy()
+    xs, ys = unit_star(points, inner_ratio)
+    table = np.empty(4 * points)
+    table[0::2] = xs
+    table[1::2] = ys
+    return table
+
+
+def star_points(x1, y1, x2, y2, points=5, inner_ratio=0.4):
+    cx = (x1 + x2) / 2
+    cy = (y1 + y2) / 2
+    r = min(abs(x2 - x1), abs(y2 - y1)) / 2
+    xs, ys = unit_star(points, inner_ratio)
+    coords = [0.0] * (4 * points)
+    coords[0::2] = [cx + r * x for x in xs]
+    coords[1::2] = [cy + r * y for y in ys]
+    return coords
+
+
+def star_points_many(x1, y1, x2, y2, points=5, inner_ratio=0.4):
+    np = _numpy()
+    if np is None:
+        return [star_points(*box, points, inner_ratio) for box in zip(x1, y1, x2, y2)]
+    x1, y1, x2, y2 = (np.asarray(c, dtype=float) for c in (x1, y1, x2, y2))
+    centers = np.empty((len(x1), 4 * points))
+    centers[:, 0::2] = ((x1 + x2) / 2)[:, None]
+    centers[:, 1::2] = ((y1 + y2) / 2)[:, None]
+    r = np.minimum(np.abs(x2 - x1), np.abs(y2 - y1)) / 2
+    return centers + r[:, None] * _unit_star_array(points, inner_ratio)
+
+
 class Star(Shape):
+    def __init__(self, x1, y1, points=5, inner_ratio=0.4):
+        super().__init__(x1, y1)
+        self.points = points
+        self.inner_ratio = inner_ratio
+
     def _calculate_points(self):
-        cx = (self.x1 + self.x2) / 2
-        cy = (self.y1 + self.y2) / 2
-        r_outer = min(abs(self.x2 - self.x1), abs(self.y2 - self.y1)) / 2
-        r_inner = r_outer * 0.4
-        points = []
-        for i in range(10):
-            angle = math.pi / 2 + (2 * math.pi * i / 10)
-            r = r_outer if i % 2 == 0 else r_inner
-            x = cx + r * math.cos(angle)
-            y = cy - r * math.sin(angle)
-            points.extend([x, y])
-        return points
+        return star_points(self.x1, self.y1, self.x2, self.y2, self.points, self.inner_ratio)
+
+    def coords(self):
+        return self._calculate_points()
 
     def draw(self, canvas):
         return canvas.create_polygon(self._calculate_points(),
@@ -24,3 +77,6 @@ class Star(Shape):
     def draw_rubber(self, canvas):
         return canvas.create_polygon(self._calculate_points(),
                                      outline='black', fill='', width=1)
+
+    def draw_raster(self, draw):
+        draw.polygon(self._calculate_points(), outline='black', fill='yellow', width=2)
@@ -1,3 +1,5 @@
-from .tooltips import create_tooltip
+from .tooltips import create_tooltip, TooltipManager
+from .raster import RasterLayer
+from .lod import LodRenderer
 
-__all__ = ["create_tooltip"]
+__all__ = ["create_tooltip", "TooltipManager", "RasterLayer", "LodRenderer"]
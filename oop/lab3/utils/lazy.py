@@ -0,0 +1,11 @@
+from functools import lru_cache
+from importlib import import_module
+
+
+@lru_cache(maxsize=None)
+def optional_import(name):
+    # необов'язкові залежності (NumPy, Pillow) вантажаться при першому зверненні, а не разом з utils
+    try:
+        return import_module(name)
+    except ImportError:
+        return None
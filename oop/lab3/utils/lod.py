@@ -0,0 +1,149 @@
+from array import array
+from collections import namedtuple
+
+from .lazy import optional_import
+
+
+LodPlan = namedtuple('LodPlan', 'full points dense')
+
+
+class LodRenderer:
+    MIN_SIZE = 3
+    CELL = 2
+    # на полотні кожна позначка - окремий елемент, тож точки групуються грубіше
+    CANVAS_CELL = 16
+    COARSE = 32
+    MAX_PER_CELL = 16
+
+    def __init__(self, min_size=MIN_SIZE, cell=CELL, coarse=COARSE, max_per_cell=MAX_PER_CELL,
+                 canvas_cell=CANVAS_CELL):
+        self.min_size = min_size
+        self.cell = cell
+        self.canvas_cell = canvas_cell
+        self.coarse = coarse
+        self.max_per_cell = max_per_cell
+        self.shapes = []
+        self.left = array('i')
+        self.top = array('i')
+        self.right = array('i')
+        self.bottom = array('i')
+
+    def __len__(self):
+        return len(self.shapes)
+
+    def add(self, shape):
+        x1, y1, x2, y2 = shape.bbox()
+        self.add_bbox(int(x1), int(y1), int(x2), int(y2))
+        self.shapes.append(shape)
+
+    def add_bbox(self, x1, y1, x2, y2):
+        self.left.append(x1)
+        self.top.append(y1)
+        self.right.append(x2)
+        self.bottom.append(y2)
+
+    def clear(self):
+        self.shapes.clear()
+        for column in (self.left, self.top, self.right, self.bottom):
+            del column[:]
+
+    def plan(self, width, height, cell=None):
+        if not len(self.left):
+            return LodPlan([], [], [])
+        cell = cell or self.cell
+        np = optional_import('numpy')
+        if np is not None:
+            return self._plan_numpy(np, width, height, cell)
+        return self._plan_python(width, height, cell)
+
+    def _plan_numpy(self, np, width, height, cell):
+        left = np.frombuffer(self.left, dtype=np.int32)
+        top = np.frombuffer(self.top, dtype=np.int32)
+        right = np.frombuffer(self.right, dtype=np.int32)
+        bottom = np.frombuffer(self.bottom, dtype=np.int32)
+
+        visible = (right >= 0) & (bottom >= 0) & (left < width) & (top < height)
+        size = np.maximum(right - left, bottom - top)
+        tiny = visible & (size < self.min_size)
+        large = np.flatnonzero(visible & ~tiny)
+
+        cx = np.clip((left + right) // 2, 0, width - 1)
+        cy = np.clip((top + bottom) // 2, 0, height - 1)
+        columns = -(-width // cell)
+        fine = (cy[tiny] // cell) * columns + cx[tiny] // cell
+        cells, counts = np.unique(fine, return_counts=True)
+        points = [(int(c % columns) * cell, int(c // columns) * cell, int(n))
+                  for c, n in zip(cells, counts)]
+
+        coarse_columns = -(-width // self.coarse)
+        coarse = (cy[large] // self.coarse) * coarse_columns + cx[large] // self.coarse
+        # верхні (пізніші) фігури кожної клітинки малюються повністю, решта - лише щільністю
+        order = np.lexsort((-large, coarse))
+        sorted_cells = coarse[order]
+        starts = np.flatnonzero(np.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+        rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+        keep = rank < self.max_per_cell
+        full = np.sort(large[order[keep]]).tolist()
+
+        hidden_cells, hidden_counts = np.unique(sorted_cells[~keep], return_counts=True)
+        dense = [(int(c % coarse_columns) * self.coarse, int(c // coarse_columns) * self.coarse, int(n))
+                 for c, n in zip(hidden_cells, hidden_counts)]
+        return LodPlan(full, points, dense)
+
+    def _plan_python(self, width, height, cell):
+        points = {}
+        per_cell = {}
+        hidden = {}
+        for index in range(len(self.left) - 1, -1, -1):
+            left, top = self.left[index], self.top[index]
+            right, bottom = self.right[index], self.bottom[index]
+            if right < 0 or bottom < 0 or left >= width or top >= height:
+                continue
+            cx = min(max((left + right) // 2, 0), width - 1)
+            cy = min(max((top + bottom) // 2, 0), height - 1)
+            if max(right - left, bottom - top) < self.min_size:
+                key = (cx // cell * cell, cy // cell * cell)
+                points[key] = points.get(key, 0) + 1
+                continue
+            key = (cx // self.coarse * self.coarse, cy // self.coarse * self.coarse)
+            members = per_cell.setdefault(key, [])
+            if len(members) < self.max_per_cell:
+                members.append(index)
+            else:
+                hidden[key] = hidden.get(key, 0) + 1
+        full = sorted(index for members in per_cell.values() for index in members)
+        points = [(x, y, n) for (y, x), n in sorted((key[::-1], n) for key, n in points.items())]
+        dense = [(x, y, n) for (y, x), n in sorted((key[::-1], n) for key, n in hidden.items())]
+        return LodPlan(full, points, dense)
+
+    def _shade(self, count):
+        level = max(96, 224 - 16 * count)
+        return '#%02x%02x%02x' % (level, level, level)
+
+    def render_raster(self, draw, width, height):
+        plan = self.plan(width, height)
+        for x, y, count in plan.dense:
+            draw.rectangle((x, y, x + self.coarse - 1, y + self.coarse - 1), fill=self._shade(count))
+        for x, y, count in plan.points:
+            draw.rectangle((x, y, x + self.cell - 1, y + self.cell - 1),
+                           fill='black' if count > 1 else 'gray')
+        shapes = self.shapes
+        for index in plan.full:
+            draw_raster = shapes[index].draw_raster
+            if draw_raster is not None:
+                draw_raster(draw)
+        return plan
+
+    def render_canvas(self, canvas, width, height, tag='lod'):
+        plan = self.plan(width, height, self.canvas_cell)
+        canvas.delete(tag)
+        for x, y, count in plan.dense:
+            canvas.create_rectangle(x, y, x + self.coarse, y + self.coarse,
+                                    fill=self._shade(count), outline='', tags=(tag,))
+        for x, y, count in plan.points:
+            canvas.create_rectangle(x, y, x + self.canvas_cell, y + self.canvas_cell,
+                                    fill=self._shade(count), outline='', tags=(tag,))
+        for index in plan.full:
+            item = self.shapes[index].draw(canvas)
+            canvas.addtag_withtag(tag, item)
+        return plan
@@ -0,0 +1,99 @@
+from .lazy import optional_import
+
+
+class RasterLayer:
+    TILE = 256
+    BACKGROUND = 'white'
+
+    def __init__(self, canvas, width, height, tile=TILE):
+        self.canvas = canvas
+        self.tile = tile
+        self.width = 0
+        self.height = 0
+        self.image = None
+        self.draw = None
+        self.tiles = {}
+        self.dirty = set()
+        self.flush_job = None
+        self.shapes_drawn = 0
+        self.tiles_flushed = 0
+        self.resize(width, height)
+
+    @staticmethod
+    def available():
+        return optional_import('PIL.ImageTk') is not None
+
+    def resize(self, width, height):
+        width = max(width, self.width)
+        height = max(height, self.height)
+        if (width, height) == (self.width, self.height):
+            return
+        Image = optional_import('PIL.Image')
+        ImageDraw = optional_import('PIL.ImageDraw')
+        image = Image.new('RGB', (width, height), self.BACKGROUND)
+        if self.image is not None:
+            image.paste(self.image, (0, 0))
+        self.image = image
+        self.draw = ImageDraw.Draw(image)
+        self.width, self.height = width, height
+
+        for tx in range(-(-width // self.tile)):
+            for ty in range(-(-height // self.tile)):
+                if (tx, ty) not in self.tiles:
+                    self.dirty.add((tx, ty))
+        self.schedule_flush()
+
+    def _tile_box(self, tx, ty):
+        x, y = tx * self.tile, ty * self.tile
+        return x, y, min(x + self.tile, self.width), min(y + self.tile, self.height)
+
+    def mark_dirty(self, box):
+        x1, y1, x2, y2 = box
+        x1, y1 = max(int(x1) - 2, 0), max(int(y1) - 2, 0)
+        x2, y2 = min(int(x2) + 2, self.width - 1), min(int(y2) + 2, self.height - 1)
+        if x1 > x2 or y1 > y2:
+            return
+        for tx in range(x1 // self.tile, x2 // self.tile + 1):
+            for ty in range(y1 // self.tile, y2 // self.tile + 1):
+                self.dirty.add((tx, ty))
+        self.schedule_flush()
+
+    def add(self, shape):
+        if shape.draw_raster is None:
+            return False
+        shape.draw_raster(self.draw)
+        self.shapes_drawn += 1
+        self.mark_dirty(shape.bbox())
+        return True
+
+    def clear(self):
+        self.draw.rectangle((0, 0, self.width, self.height), fill=self.BACKGROUND)
+        self.dirty.update(self.tiles)
+        self.shapes_drawn = 0
+        self.schedule_flush()
+
+    def schedule_flush(self):
+        if self.flush_job is None:
+            self.flush_job = self.canvas.after_idle(self.flush)
+
+    def flush(self):
+        self.flush_job = None
+        ImageTk = optional_import('PIL.ImageTk')
+        for key in self.dirty:
+            box = self._tile_box(*key)
+            crop = self.image.crop(box)
+            entry = self.tiles.get(key)
+            if entry is None or entry[0].width() != crop.width or entry[0].height() != crop.height:
+                photo = ImageTk.PhotoImage(crop)
+                if entry is None:
+                    item = self.canvas.create_image(box[0], box[1], image=photo,
+                                                    anchor='nw', tags=('raster',))
+                else:
+                    item = entry[1]
+                    self.canvas.itemconfigure(item, image=photo)
+                self.tiles[key] = (photo, item)
+            else:
+                entry[0].paste(crop)
+            self.tiles_flushed += 1
+        self.dirty.clear()
+        self.canvas.tag_lower('raster')
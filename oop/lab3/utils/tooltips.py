@@ -1,19 +1,89 @@
 import tkinter as tk
 
+
+class TooltipManager:
+    SHOW_DELAY = 500
+    HIDE_DELAY = 100
+
+    _managers = {}
+
+    def __init__(self, root):
+        self.root = root
+        self.window = None
+        self.label = None
+        self.visible = False
+        self.show_job = None
+        self.hide_job = None
+        self.texts = {}
+        self.position = (0, 0)
+        self.windows_created = 0
+
+    @classmethod
+    def for_widget(cls, widget):
+        root = widget._root()
+        manager = cls._managers.get(root)
+        if manager is None:
+            manager = cls._managers[root] = cls(root)
+            root.bind('<Destroy>', manager.on_root_destroy, add='+')
+        return manager
+
+    def on_root_destroy(self, event):
+        if event.widget is self.root:
+            self._managers.pop(self.root, None)
+
+    def register(self, widget, text):
+        self.texts[str(widget)] = text
+        widget.bind('<Enter>', self.on_enter, add='+')
+        widget.bind('<Leave>', self.on_leave, add='+')
+
+    def _create_window(self):
+        self.window = tk.Toplevel(self.root)
+        self.window.withdraw()
+        self.window.wm_overrideredirect(True)
+        self.label = tk.Label(self.window, background="lightyellow",
+                              relief=tk.SOLID, borderwidth=1, padx=5, pady=2)
+        self.label.pack()
+        self.windows_created += 1
+
+    def _cancel(self, job):
+        if job is not None:
+            self.root.after_cancel(job)
+
+    def on_enter(self, event):
+        self._cancel(self.hide_job)
+        self.hide_job = None
+        self._cancel(self.show_job)
+        self.position = (event.x_root + 10, event.y_root + 10)
+        text = self.texts.get(str(event.widget))
+        if self.visible:
+            self.show_job = None
+            self.show(text)
+        else:
+            self.show_job = self.root.after(self.SHOW_DELAY, self.show, text)
+
+    def on_leave(self, event):
+        self._cancel(self.show_job)
+        self.show_job = None
+        if self.visible and self.hide_job is None:
+            self.hide_job = self.root.after(self.HIDE_DELAY, self.hide)
+
+    def show(self, text):
+        self.show_job = None
+        if self.window is None:
+            self._create_window()
+        self.label.config(text=text)
+        self.window.wm_geometry("+%d+%d" % self.position)
+        if not self.visible:
+            self.window.deiconify()
+            self.window.lift()
+            self.visible = True
+
+    def hide(self):
+        self.hide_job = None
+        if self.visible:
+            self.window.withdraw()
+            self.visible = False
+
+
 def create_tooltip(widget, text):
-    def on_enter(event):
-        tooltip = tk.Toplevel()
-        tooltip.wm_overrideredirect(True)
-        tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-        label = tk.Label(tooltip, text=text, background="lightyellow",
-                         relief=tk.SOLID, borderwidth=1, padx=5, pady=2)
-        label.pack()
-        widget.tooltip = tooltip
-
-    def on_leave(event):
-        if hasattr(widget, 'tooltip'):
-            widget.tooltip.destroy()
-            del widget.tooltip
-
-    widget.bind('<Enter>', on_enter)
-    widget.bind('<Leave>', on_leave)
+    TooltipManager.for_widget(widget).register(widget, text)